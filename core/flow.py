@@ -8,20 +8,27 @@ This module defines PocketFlow workflows for processing various types of content
 
 The flows are designed to be modular and configurable, supporting both
 content acquisition (Phase 1) and content refinement (Phase 2).
+
+Each factory is memoized: a graph is wired once per process and reused by every
+run. This is safe because Flow.run() copies each node before executing it and
+all per-run state lives in SharedMemory, never on the node instances.
 """
 
+import functools
+
 from pocketflow import Flow
 
-from .nodes import (
-    AsyncRefinementCoordinatorNode,
-    FlowCompletionNode,
-    InputExpansionNode,
-    ParallelAcquisitionCoordinatorNode,
-    RefinementTaskCreatorNode,
-    TempFileCleanupNode,
-)
+# Node classes are imported inside each factory: core.nodes pulls in the
+# downloader/ASR/LLM stacks, which only need loading once a flow is built.
+
+
+def _wire(edges) -> None:
+    """Connect (src, action, dst) edges; same as ``src - action >> dst`` per edge."""
+    for src, action, dst in edges:
+        src.next(dst, action)
 
 
+@functools.lru_cache(maxsize=1)
 def create_bodhi_flow() -> Flow:
     """
     Create the complete BodhiFlow workflow (both phases).
@@ -37,6 +44,14 @@ def create_bodhi_flow() -> Flow:
     Returns:
         Flow: A PocketFlow instance ready to process content
     """
+    from .nodes import (
+        AsyncRefinementCoordinatorNode,
+        FlowCompletionNode,
+        InputExpansionNode,
+        ParallelAcquisitionCoordinatorNode,
+        RefinementTaskCreatorNode,
+        TempFileCleanupNode,
+    )
 
     # Create all nodes
     input_expansion = InputExpansionNode()
@@ -46,25 +61,24 @@ def create_bodhi_flow() -> Flow:
     temp_cleanup = TempFileCleanupNode()
     flow_completion = FlowCompletionNode()
 
-    # Phase 1: Content Acquisition connections
-    input_expansion - "start_parallel_acquisition" >> parallel_acquisition
-    input_expansion - "phase_1_complete_no_input" >> refinement_task_creator
-
-    parallel_acquisition - "phase_1_complete" >> refinement_task_creator
-
-    # Phase 2: Content Refinement connections
-    refinement_task_creator - "start_async_refinement" >> async_refinement
-    refinement_task_creator - "phase_2_complete_no_tasks" >> temp_cleanup
-
-    async_refinement - "phase_2_complete" >> temp_cleanup
-
-    # Cleanup and completion
-    temp_cleanup - "cleanup_complete" >> flow_completion
+    _wire((
+        # Phase 1: Content Acquisition connections
+        (input_expansion, "start_parallel_acquisition", parallel_acquisition),
+        (input_expansion, "phase_1_complete_no_input", refinement_task_creator),
+        (parallel_acquisition, "phase_1_complete", refinement_task_creator),
+        # Phase 2: Content Refinement connections
+        (refinement_task_creator, "start_async_refinement", async_refinement),
+        (refinement_task_creator, "phase_2_complete_no_tasks", temp_cleanup),
+        (async_refinement, "phase_2_complete", temp_cleanup),
+        # Cleanup and completion
+        (temp_cleanup, "cleanup_complete", flow_completion),
+    ))
 
     # Create flow starting with input expansion
     return Flow(start=input_expansion)
 
 
+@functools.lru_cache(maxsize=1)
 def create_phase_1_only_flow() -> Flow:
     """
     Create a flow that only runs Phase 1 (content acquisition).
@@ -72,6 +86,12 @@ def create_phase_1_only_flow() -> Flow:
     Returns:
         Flow: Phase 1 only PocketFlow
     """
+    from .nodes import (
+        FlowCompletionNode,
+        InputExpansionNode,
+        ParallelAcquisitionCoordinatorNode,
+        TempFileCleanupNode,
+    )
 
     # Create Phase 1 nodes
     input_expansion = InputExpansionNode()
@@ -80,16 +100,17 @@ def create_phase_1_only_flow() -> Flow:
     flow_completion = FlowCompletionNode()
 
     # Phase 1 connections
-    input_expansion - "start_parallel_acquisition" >> parallel_acquisition
-    input_expansion - "phase_1_complete_no_input" >> flow_completion
-
-    parallel_acquisition - "phase_1_complete" >> temp_cleanup
-
-    temp_cleanup - "cleanup_complete" >> flow_completion
+    _wire((
+        (input_expansion, "start_parallel_acquisition", parallel_acquisition),
+        (input_expansion, "phase_1_complete_no_input", flow_completion),
+        (parallel_acquisition, "phase_1_complete", temp_cleanup),
+        (temp_cleanup, "cleanup_complete", flow_completion),
+    ))
 
     return Flow(start=input_expansion)
 
 
+@functools.lru_cache(maxsize=1)
 def create_phase_2_only_flow() -> Flow:
     """
     Create a flow that only runs Phase 2 (content refinement).
@@ -99,6 +120,11 @@ def create_phase_2_only_flow() -> Flow:
     Returns:
         Flow: Phase 2 only PocketFlow
     """
+    from .nodes import (
+        AsyncRefinementCoordinatorNode,
+        FlowCompletionNode,
+        RefinementTaskCreatorNode,
+    )
 
     # Create Phase 2 nodes
     refinement_task_creator = RefinementTaskCreatorNode()
@@ -106,10 +132,11 @@ def create_phase_2_only_flow() -> Flow:
     flow_completion = FlowCompletionNode()
 
     # Phase 2 connections
-    refinement_task_creator - "start_async_refinement" >> async_refinement
-    refinement_task_creator - "phase_2_complete_no_tasks" >> flow_completion
-
-    async_refinement - "phase_2_complete" >> flow_completion
+    _wire((
+        (refinement_task_creator, "start_async_refinement", async_refinement),
+        (refinement_task_creator, "phase_2_complete_no_tasks", flow_completion),
+        (async_refinement, "phase_2_complete", flow_completion),
+    ))
 
     return Flow(start=refinement_task_creator)
 
@@ -124,19 +151,23 @@ def create_flow_for_phases(run_phase_1: bool, run_phase_2: bool) -> Flow:
         run_phase_2 (bool): Whether to run Phase 2 (content refinement)
 
     Returns:
-        Flow: Appropriate PocketFlow for the selected phases
+        Flow: Appropriate PocketFlow for the selected phases (cached instance)
 
     Raises:
         ValueError: If neither phase is selected
     """
-
-    if run_phase_1 and run_phase_2:
-        return create_bodhi_flow()
-    elif run_phase_1 and not run_phase_2:
-        return create_phase_1_only_flow()
-    elif not run_phase_1 and run_phase_2:
-        return create_phase_2_only_flow()
-    else:
+    try:
+        factory = _FLOW_BY_PHASES[(bool(run_phase_1), bool(run_phase_2))]
+    except KeyError:
         raise ValueError(
             "At least one phase must be selected (run_phase_1 or run_phase_2)"
-        )
+        ) from None
+    return factory()
+
+
+# (run_phase_1, run_phase_2) -> flow factory; (False, False) is deliberately absent.
+_FLOW_BY_PHASES = {
+    (True, True): create_bodhi_flow,
+    (True, False): create_phase_1_only_flow,
+    (False, True): create_phase_2_only_flow,
+}
@@ -4,41 +4,114 @@ GUI and CLI launch for BodhiFlow.
 Provides launch_gui() and main_cli() so main.pyw / main.py can be thin entry points.
 """
 
+import functools
+import os
 import sys
 from pathlib import Path
 
-from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QFile, QIODevice, Qt
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtWidgets import QApplication, QSplashScreen
 
 # Project root = parent of core/
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
+_DISK_STYLESHEET_PATH = str(_PROJECT_ROOT / "gui" / "styles.qss")
+
+# Prefer the compiled Qt resource (pyrcc5 gui/resources.qrc -o gui/resources_rc.py)
+# so the stylesheet is served from memory; fall back to the file on disk.
+try:
+    from gui import resources_rc  # registers ":/styles.qss"
+except ImportError:
+    resources_rc = None
+
+
+def _choose_stylesheet_path() -> str:
+    """
+    The compiled ":/styles.qss" resource, unless gui/styles.qss on disk was
+    edited after resources_rc.py was generated (then the disk file wins, so
+    QSS edits show up without re-running pyrcc5).
+    """
+    if resources_rc is None:
+        return _DISK_STYLESHEET_PATH
+    try:
+        if os.stat(_DISK_STYLESHEET_PATH).st_mtime_ns > os.stat(resources_rc.__file__).st_mtime_ns:
+            return _DISK_STYLESHEET_PATH
+    except OSError:
+        pass
+    return ":/styles.qss"
+
+
+def _stylesheet_mtime(path: str) -> int:
+    """Modification time used to key the stylesheet cache; 0 for Qt resources or a missing file."""
+    if path.startswith(":"):
+        return 0
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+@functools.lru_cache(maxsize=4)
+def _load_stylesheet(path: str, mtime: int) -> str:
+    """Read and decode the stylesheet once per (path, mtime); "" if it cannot be opened."""
+    f = QFile(path)
+    # One readAll() into a QByteArray: Qt's own buffering would only add a copy.
+    if not f.open(QIODevice.ReadOnly | QIODevice.Unbuffered):
+        return ""
+    try:
+        return bytes(f.readAll()).decode("utf-8", "replace")
+    finally:
+        f.close()
+
 
 def launch_gui():
     """Launch the PyQt5 GUI application."""
-    from gui.main_window import BodhiFlow_GUI_MainWindow
     from utils.logger_config import get_logger
 
     logger = get_logger(__name__)
+    # Keep native window handles to the widgets that need them, and let
+    # QIcon hand out high-DPI pixmaps instead of scaling at paint time.
+    QApplication.setAttribute(Qt.AA_DontCreateNativeWidgetSiblings, True)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
     app = QApplication(sys.argv)
 
-    stylesheet_path = _PROJECT_ROOT / "gui" / "styles.qss"
-    try:
-        with open(stylesheet_path, "r", encoding="utf-8") as f:
-            app.setStyleSheet(f.read())
-            logger.info(f"Stylesheet loaded from: {stylesheet_path}")
-    except FileNotFoundError:
-        logger.warning(
-            f"Stylesheet not found at: {stylesheet_path}. Using default styles."
+    # Paint a splash first so something is on screen while the main window
+    # module (and everything it imports) is still loading.
+    splash = None
+    splash_pixmap = QPixmap(str(_PROJECT_ROOT / "BodhiFlow.ico"))
+    if not splash_pixmap.isNull():
+        splash = QSplashScreen(splash_pixmap)
+        splash.show()
+        app.processEvents()
+
+    stylesheet_path = _choose_stylesheet_path()
+    if resources_rc is not None and stylesheet_path == _DISK_STYLESHEET_PATH:
+        logger.info(
+            "gui/styles.qss is newer than gui/resources_rc.py; loading it from disk"
         )
+    try:
+        stylesheet = _load_stylesheet(stylesheet_path, _stylesheet_mtime(stylesheet_path))
+        if stylesheet:
+            app.setStyleSheet(stylesheet)
+            logger.debug("Stylesheet loaded from: %s", stylesheet_path)
+        else:
+            logger.warning(
+                "Stylesheet not found at: %s. Using default styles.", stylesheet_path
+            )
     except Exception as e:
-        logger.error(f"Error loading stylesheet: {e}")
+        logger.error("Error loading stylesheet: %s", e)
 
     app.setApplicationName("BodhiFlow")
     app.setApplicationDisplayName("BodhiFlow - Content to Wisdom")
     app.setApplicationVersion("2.0")
 
+    from gui.main_window import BodhiFlow_GUI_MainWindow
+
     main_window = BodhiFlow_GUI_MainWindow()
     main_window.show()
+    if splash is not None:
+        splash.finish(main_window)
     sys.exit(app.exec_())
 
 
@@ -14,9 +14,11 @@ Each node follows the PocketFlow pattern with prep(), exec(), and post() methods
 """
 
 import asyncio
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List
 
 from pocketflow import Node
 
@@ -30,16 +32,145 @@ from utils.input_handler import (
     list_document_files_in_folder,
     clean_filename,
 )
-from utils.llm_refiner import async_refine_single_task, create_refinement_tasks
+from utils.metadata_cache import METADATA_TTL_SECONDS, MetadataCache
 from utils.models_config import get_model_by_id
-from utils.acquisition_processor import process_single_video_acquisition
-from utils.youtube_downloader import (
-    get_video_title,
-    get_video_urls_from_playlist,
-    fetch_youtube_metadata,
-)
-from utils.podcast_parser import get_podcast_info, parse_podcast_rss
-from utils.teams_meeting import derive_meeting_title
+
+# The YouTube, podcast, Teams, acquisition and LLM utilities pull in yt-dlp,
+# feedparser, ffmpeg and the LLM SDKs; they are imported in the branch or node
+# that uses them, so a run only loads what its inputs need.
+
+
+# Phase 1 worker pool, kept alive between runs so workers (and their imports)
+# are only started once. Replaced when the requested size changes or a worker
+# crash has broken it.
+_acquisition_pool: tuple[int, ProcessPoolExecutor] | None = None
+
+
+def _get_acquisition_executor(max_workers: int, replace: bool = False) -> ProcessPoolExecutor:
+    """Return the shared Phase 1 process pool sized to max_workers."""
+    global _acquisition_pool
+    if _acquisition_pool is not None:
+        size, executor = _acquisition_pool
+        if size == max_workers and not replace:
+            return executor
+        executor.shutdown(wait=False)
+    _acquisition_pool = (max_workers, ProcessPoolExecutor(max_workers=max_workers))
+    return _acquisition_pool[1]
+
+
+def reset_acquisition_pool() -> None:
+    """Retire the shared Phase 1 pool, dropping any work still queued on it."""
+    global _acquisition_pool
+    if _acquisition_pool is not None:
+        _acquisition_pool[1].shutdown(wait=False, cancel_futures=True)
+        _acquisition_pool = None
+
+
+# Event loop for Phase 2, kept between runs (like the acquisition pool) so its
+# default executor threads, and the LLM clients' connections they hold, are
+# reused instead of being torn down by asyncio.run() every run
+_refinement_loop: asyncio.AbstractEventLoop | None = None
+# The loop's default executor (the threads the blocking LLM calls run on); held
+# here so it can still be shut down if the loop itself cannot be
+_refinement_executor: ThreadPoolExecutor | None = None
+
+
+def _get_refinement_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared Phase 2 event loop, replacing it if it is unusable."""
+    global _refinement_loop, _refinement_executor
+    loop = _refinement_loop
+    # A loop still flagged as running belongs to a runner thread that was
+    # terminated inside run_until_complete()
+    if loop is None or loop.is_closed() or loop.is_running():
+        reset_refinement_loop()
+        _refinement_executor = ThreadPoolExecutor(thread_name_prefix="bodhiflow-refine")
+        loop = _refinement_loop = asyncio.new_event_loop()
+        loop.set_default_executor(_refinement_executor)
+    return loop
+
+
+def reset_refinement_loop() -> None:
+    """Shut down and forget the shared Phase 2 event loop and its executor."""
+    global _refinement_loop, _refinement_executor
+    loop, executor = _refinement_loop, _refinement_executor
+    _refinement_loop = _refinement_executor = None
+    if loop is not None and not loop.is_closed() and not loop.is_running():
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            loop.close()
+    # A loop left running by a killed thread can be neither stopped nor
+    # closed; it is dropped, and its queued LLM calls are cancelled here
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+# How often Phase 1 checks for cancellation while no acquisition has finished
+_STOP_POLL_SECONDS = 0.25
+
+# Concurrent yt-dlp metadata requests while expanding a playlist
+_METADATA_FETCH_WORKERS = 16
+
+
+def _stop_check(shared) -> Callable[[], bool]:
+    """
+    The run's cancellation check: the runner's stop event when it supplied one
+    (is_set is a plain flag read), else stop_check_callback.
+    """
+    if shared.stop_event is not None:
+        return shared.stop_event.is_set
+    return shared.stop_check_callback or (lambda: False)
+
+
+def _phase2_model_id(shared) -> str:
+    """The Phase 2 model id for this run, with the legacy Gemini setting as fallback."""
+    return shared.phase2_model_id or shared.selected_gemini_model or "zai/glm-7-flash"
+
+
+def _fetch_metadata_cached(url: str, cookie_file_path, cache: MetadataCache) -> dict:
+    """fetch_youtube_metadata() for one video, answered from cache when a previous run fetched it."""
+    from utils.youtube_downloader import fetch_youtube_metadata
+
+    meta = cache.get("metadata", url, cookie_file_path)
+    if meta is not None:
+        return dict(meta)
+    meta = fetch_youtube_metadata(url, cookie_file_path)
+    if "channel" in meta:  # a failed fetch returns only title/source_url; don't keep that
+        cache.set("metadata", url, meta, METADATA_TTL_SECONDS, cookie_file_path)
+    return meta
+
+
+def _fetch_playlist_metadata(urls: list, cookie_file_path, cache: MetadataCache) -> list:
+    """
+    Fetch metadata for many videos on a thread pool (the calls are network-bound).
+
+    Returns:
+        One metadata dict per URL, in the order of urls
+    """
+    if not urls:
+        return []
+    with ThreadPoolExecutor(max_workers=min(_METADATA_FETCH_WORKERS, len(urls))) as executor:
+        return list(executor.map(lambda url: _fetch_metadata_cached(url, cookie_file_path, cache), urls))
+
+
+def _existing_safe_titles(intermediate_dir: str) -> set:
+    """
+    Safe titles that already have a transcript ({safe_title}_raw_transcript.txt)
+    in intermediate_dir, read in one directory scan.
+    """
+    suffix = "_raw_transcript.txt"
+    cut = -len(suffix)
+    titles = set()
+    try:
+        with os.scandir(intermediate_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith(suffix) and entry.is_file():
+                    titles.add(name[:cut])
+    except OSError:  # missing folder: nothing to resume from
+        pass
+    return titles
 
 
 def _apply_range(items: list, start_index: int, end_index: int) -> list:
@@ -96,33 +227,22 @@ class InputExpansionNode(Node):
 
     def prep(self, shared):
         prep_data = {
-            "user_input_path": shared["user_input_path"],
-            "start_index": shared["start_index"],
-            "end_index": shared["end_index"],
-            "cookie_file_path": shared["cookie_file_path"],
-            "status_callback": shared["status_update_callback"],
-            "resume_mode": shared.get("resume_mode", False),
-            "intermediate_dir": shared["intermediate_dir"],
-            "input_mode_hint": shared.get("input_mode_hint"),
-            "document_folder_recursive": shared.get("document_folder_recursive", True),
-            "csv_jobs": shared.get("csv_jobs", []),
-            "job_overrides": shared.get("job_overrides", {}),
+            "user_input_path": shared.user_input_path,
+            "start_index": shared.start_index,
+            "end_index": shared.end_index,
+            "cookie_file_path": shared.cookie_file_path,
+            "status_callback": shared.status_update_callback,
+            "resume_mode": shared.resume_mode,
+            "intermediate_dir": shared.intermediate_dir,
+            "input_mode_hint": shared.input_mode_hint,
+            "document_folder_recursive": shared.document_folder_recursive,
+            "csv_jobs": shared.csv_jobs,
+            "job_overrides": shared.job_overrides,
         }
 
         # If resume mode is enabled, get existing transcript files for filtering
         if prep_data["resume_mode"]:
-            existing_transcript_files = discover_raw_transcript_files(
-                shared["intermediate_dir"]
-            )
-            # Extract video titles from transcript file names
-            # File pattern: {safe_title}_raw_transcript.txt
-            existing_titles = set()
-            for file_path in existing_transcript_files:
-                filename = Path(file_path).stem  # Remove .txt extension
-                # Remove '_raw_transcript' suffix to get the safe title
-                if filename.endswith("_raw_transcript"):
-                    safe_title = filename[: -len("_raw_transcript")]
-                    existing_titles.add(safe_title)
+            existing_titles = _existing_safe_titles(shared.intermediate_dir)
             prep_data["existing_titles"] = existing_titles
             prep_data["status_callback"](
                 f"Resume mode: Found {len(existing_titles)} existing transcript files. Will retry source(s) without transcripts.",
@@ -134,7 +254,9 @@ class InputExpansionNode(Node):
         return prep_data
 
     def exec(self, prep_data):
-        prep_data["status_callback"]("Expanding input sources...", StatusType.INFO)
+        # Values used per input/item are bound to locals once
+        status_callback = prep_data["status_callback"]
+        status_callback("Expanding input sources...", StatusType.INFO)
 
         start_index = prep_data["start_index"]
         end_index = prep_data["end_index"]
@@ -142,6 +264,8 @@ class InputExpansionNode(Node):
         resume_mode = prep_data["resume_mode"]
         existing_titles = prep_data["existing_titles"]
         csv_jobs = prep_data.get("csv_jobs") or []
+        single_mode_hint = prep_data.get("input_mode_hint")
+        recursive = prep_data.get("document_folder_recursive", True)
 
         # Build list of (input_path, job_id). Single run: one item with job_id=0; CSV: one per job.
         if csv_jobs:
@@ -149,7 +273,7 @@ class InputExpansionNode(Node):
         else:
             user_input_path = (prep_data.get("user_input_path") or "").strip()
             if user_input_path == "No Input Allowed":
-                prep_data["status_callback"](
+                status_callback(
                     "Phase 2 Only mode: No input processing needed", StatusType.INFO
                 )
                 return []
@@ -160,42 +284,71 @@ class InputExpansionNode(Node):
 
         video_sources_queue = []
         skipped_count = 0
+        meta_cache = None  # MetadataCache, opened for the first YouTube input
+        # get_input_type() per (input, hint) for this run; CSV batches often repeat inputs.
+        # Not cached across runs: local paths may appear or change between runs.
+        input_types = {}
 
         for user_input_path, job_id in inputs_to_expand:
-            input_mode_hint = prep_data.get("input_mode_hint") if job_id == 0 else None
-            input_type = get_input_type(user_input_path, input_mode_hint)
+            input_mode_hint = single_mode_hint if job_id == 0 else None
+            type_key = (user_input_path, input_mode_hint)
+            input_type = input_types.get(type_key)
+            if input_type is None:
+                input_type = input_types[type_key] = get_input_type(user_input_path, input_mode_hint)
 
             if input_type == "unknown_url":
-                prep_data["status_callback"](
+                status_callback(
                     f"Unsupported URL type (job {job_id}): {user_input_path[:50]}...",
                     StatusType.ERROR,
                 )
                 continue
 
             if input_type == "youtube_playlist_url":
-                # Get all video URLs from playlist
-                urls = get_video_urls_from_playlist(user_input_path, cookie_file_path)
-                if not urls:
-                    prep_data["status_callback"](
+                # Get all video URLs from playlist. Resume mode lists titles
+                # too, so finished videos are skipped before any metadata fetch.
+                if resume_mode:
+                    from utils.youtube_downloader import get_playlist_entries
+
+                    entries = get_playlist_entries(user_input_path, cookie_file_path)
+                else:
+                    from utils.youtube_downloader import get_video_urls_from_playlist
+
+                    entries = [
+                        (url, "")
+                        for url in get_video_urls_from_playlist(user_input_path, cookie_file_path)
+                    ]
+                if not entries:
+                    status_callback(
                         f"Warning: No videos found in playlist (job {job_id})",
                         StatusType.WARNING,
                     )
                     continue
                 
-                urls = _apply_range(urls, start_index, end_index)
-                prep_data["status_callback"](
-                    f"Found {len(urls)} videos in playlist (job {job_id}, range {start_index}-{end_index if end_index > 0 else 'end'})",
+                entries = _apply_range(entries, start_index, end_index)
+                status_callback(
+                    f"Found {len(entries)} videos in playlist (job {job_id}, range {start_index}-{end_index if end_index > 0 else 'end'})",
                     StatusType.INFO,
                 )
 
-                # Get titles and create queue entries
-                for url in urls:
-                    meta = fetch_youtube_metadata(url, cookie_file_path)
-                    title = meta.get("title") or get_video_title(url)
+                urls = []
+                for url, listed_title in entries:
+                    if listed_title and _should_skip_resume(
+                        clean_filename(listed_title), existing_titles, resume_mode, listed_title, status_callback
+                    ):
+                        skipped_count += 1
+                        continue
+                    urls.append(url)
+
+                # Get titles (fetched concurrently) and create queue entries
+                if meta_cache is None:
+                    meta_cache = MetadataCache(prep_data["intermediate_dir"])
+                metas = _fetch_playlist_metadata(urls, cookie_file_path, meta_cache)
+                for url, meta in zip(urls, metas):
+                    title = meta["title"]
                     safe_title = clean_filename(title)
 
                     if _should_skip_resume(
-                        safe_title, existing_titles, resume_mode, title, prep_data["status_callback"]
+                        safe_title, existing_titles, resume_mode, title, status_callback
                     ):
                         skipped_count += 1
                         continue
@@ -214,12 +367,14 @@ class InputExpansionNode(Node):
                     )
 
             elif input_type == "youtube_video_url":
-                meta = fetch_youtube_metadata(user_input_path, cookie_file_path)
-                title = meta.get("title") or get_video_title(user_input_path)
+                if meta_cache is None:
+                    meta_cache = MetadataCache(prep_data["intermediate_dir"])
+                meta = _fetch_metadata_cached(user_input_path, cookie_file_path, meta_cache)
+                title = meta["title"]
                 safe_title = clean_filename(title)
 
                 if _should_skip_resume(
-                    safe_title, existing_titles, resume_mode, title, prep_data["status_callback"]
+                    safe_title, existing_titles, resume_mode, title, status_callback
                 ):
                     skipped_count += 1
                 else:
@@ -237,15 +392,17 @@ class InputExpansionNode(Node):
                     )
 
             elif input_type == "teams_meeting_url":
+                from utils.teams_meeting import derive_meeting_title
+
                 title = derive_meeting_title(user_input_path)
                 safe_title = clean_filename(title)
 
                 if _should_skip_resume(
-                    safe_title, existing_titles, resume_mode, title, prep_data["status_callback"]
+                    safe_title, existing_titles, resume_mode, title, status_callback
                 ):
                     skipped_count += 1
                 else:
-                    prep_data["status_callback"](
+                    status_callback(
                         f"Detected Teams meeting manifest URL", StatusType.INFO
                     )
                     video_sources_queue.append(
@@ -258,16 +415,17 @@ class InputExpansionNode(Node):
                     )
 
             elif input_type == "folder":
-                recursive = prep_data.get("document_folder_recursive", True)
                 files = list_video_files_in_folder(user_input_path, recursive=recursive)
                 files = _apply_range(files, start_index, end_index)
 
+                # Per-file loop: helpers bound to locals, title without a Path object
+                clean, splitext, basename = clean_filename, os.path.splitext, os.path.basename
                 for file_path in files:
-                    title = Path(file_path).stem
-                    safe_title = clean_filename(title)
+                    title = splitext(basename(file_path))[0]
+                    safe_title = clean(title)
 
                     if _should_skip_resume(
-                        safe_title, existing_titles, resume_mode, title, prep_data["status_callback"]
+                        safe_title, existing_titles, resume_mode, title, status_callback
                     ):
                         skipped_count += 1
                         continue
@@ -286,7 +444,7 @@ class InputExpansionNode(Node):
                 safe_title = clean_filename(title)
 
                 if _should_skip_resume(
-                    safe_title, existing_titles, resume_mode, title, prep_data["status_callback"]
+                    safe_title, existing_titles, resume_mode, title, status_callback
                 ):
                     skipped_count += 1
                 else:
@@ -300,25 +458,28 @@ class InputExpansionNode(Node):
                     )
 
             elif input_type == "podcast_rss_url":
+                from utils.podcast_parser import get_podcast_info, parse_podcast_rss
+
                 episodes = parse_podcast_rss(user_input_path, start_index, end_index)
 
                 if not episodes:
-                    prep_data["status_callback"](
+                    status_callback(
                         "No episodes found in podcast RSS feed", StatusType.ERROR
                     )
                 else:
                     podcast_info = get_podcast_info(user_input_path)
-                    prep_data["status_callback"](
+                    status_callback(
                         f"Found {len(episodes)} episodes in podcast: {podcast_info['title']}",
                         StatusType.INFO
                     )
 
+                    clean = clean_filename
                     for episode in episodes:
                         title = episode["title"]
-                        safe_title = clean_filename(title)
+                        safe_title = clean(title)
 
                         if _should_skip_resume(
-                            safe_title, existing_titles, resume_mode, title, prep_data["status_callback"]
+                            safe_title, existing_titles, resume_mode, title, status_callback
                         ):
                             skipped_count += 1
                             continue
@@ -342,7 +503,7 @@ class InputExpansionNode(Node):
                     title = Path(user_input_path).stem
                 safe_title = clean_filename(title)
                 if _should_skip_resume(
-                    safe_title, existing_titles, resume_mode, title, prep_data["status_callback"]
+                    safe_title, existing_titles, resume_mode, title, status_callback
                 ):
                     skipped_count += 1
                 else:
@@ -356,14 +517,14 @@ class InputExpansionNode(Node):
                     )
 
             elif input_type == "document_folder":
-                recursive = prep_data.get("document_folder_recursive", True)
                 files = list_document_files_in_folder(user_input_path, recursive=recursive)
                 files = _apply_range(files, start_index, end_index)
+                clean, splitext, basename = clean_filename, os.path.splitext, os.path.basename
                 for file_path in files:
-                    title = Path(file_path).stem
-                    safe_title = clean_filename(title)
+                    title = splitext(basename(file_path))[0]
+                    safe_title = clean(title)
                     if _should_skip_resume(
-                        safe_title, existing_titles, resume_mode, title, prep_data["status_callback"]
+                        safe_title, existing_titles, resume_mode, title, status_callback
                     ):
                         skipped_count += 1
                         continue
@@ -376,32 +537,35 @@ class InputExpansionNode(Node):
                         }
                     )
 
+        if meta_cache is not None:
+            meta_cache.save()
+
         # Report results
         if resume_mode:
             if skipped_count > 0:
-                prep_data["status_callback"](
+                status_callback(
                     f"Resume mode: Skipped {skipped_count} source(s) with existing transcripts",
                     StatusType.INFO,
                 )
             if len(video_sources_queue) == 0:
-                prep_data["status_callback"](
+                status_callback(
                     "Resume mode: No sources to retry. All sources already have transcripts or none found in input.",
                     StatusType.WARNING,
                 )
             else:
-                prep_data["status_callback"](
+                status_callback(
                     f"Resume mode: Will retry {len(video_sources_queue)} source(s) without transcripts",
                     StatusType.INFO,
                 )
 
-        prep_data["status_callback"](
+        status_callback(
             f"Found {len(video_sources_queue)} source(s) to process",
             StatusType.SUCCESS,
         )
         return video_sources_queue
 
     def post(self, shared, prep_res, exec_res):
-        shared["video_sources_queue"] = exec_res
+        shared.video_sources_queue = exec_res
 
         if exec_res:
             return "start_parallel_acquisition"
@@ -415,12 +579,12 @@ class ParallelAcquisitionCoordinatorNode(Node):
     """
 
     def prep(self, shared):
-        asr_model_id = shared.get("asr_model_id") or "openai/gpt-4o-transcribe"
+        asr_model_id = shared.asr_model_id or "openai/gpt-4o-transcribe"
         asr_entry = get_model_by_id(asr_model_id, "asr")
         asr_config = None
         if asr_entry:
             prov = asr_entry.get("provider", "openai")
-            key = shared.get("openai_api_key") if prov == "openai" else shared.get("zai_api_key")
+            key = shared.openai_api_key if prov == "openai" else shared.zai_api_key
             asr_config = {
                 "provider": prov,
                 "model_name": asr_entry.get("model_name", "gpt-4o-transcribe"),
@@ -429,21 +593,21 @@ class ParallelAcquisitionCoordinatorNode(Node):
             if asr_entry.get("max_chunk_duration_seconds") is not None:
                 asr_config["max_chunk_duration_seconds"] = int(asr_entry["max_chunk_duration_seconds"])
         return {
-            "video_sources_queue": shared["video_sources_queue"],
-            "max_workers_processes": shared["max_workers_processes"],
+            "video_sources_queue": shared.video_sources_queue,
+            "max_workers_processes": shared.max_workers_processes,
             "config": {
-                "temp_dir": shared["temp_dir"],
-                "intermediate_dir": shared["intermediate_dir"],
-                "openai_api_key": shared["openai_api_key"],
+                "temp_dir": shared.temp_dir,
+                "intermediate_dir": shared.intermediate_dir,
+                "openai_api_key": shared.openai_api_key,
                 "asr_config": asr_config,
-                "cookie_file_path": shared["cookie_file_path"],
-                "output_language": shared["output_language"],
-                "disable_ai_transcribe": shared.get("disable_ai_transcribe", False),
-                "save_video_on_ai_transcribe": shared.get("save_video_on_ai_transcribe", False),
+                "cookie_file_path": shared.cookie_file_path,
+                "output_language": shared.output_language,
+                "disable_ai_transcribe": shared.disable_ai_transcribe,
+                "save_video_on_ai_transcribe": shared.save_video_on_ai_transcribe,
             },
-            "status_callback": shared["status_update_callback"],
-            "progress_callback": shared["progress_update_callback"],
-            "stop_check_callback": shared.get("stop_check_callback", lambda: False),
+            "status_callback": shared.status_update_callback,
+            "progress_callback": shared.progress_update_callback,
+            "stop_check_callback": _stop_check(shared),
         }
 
     def exec(self, prep_data):
@@ -461,6 +625,8 @@ class ParallelAcquisitionCoordinatorNode(Node):
             status_callback("Processing cancelled before starting", StatusType.WARNING)
             return {}
 
+        from utils.acquisition_processor import process_single_video_acquisition
+
         # Create directories
         Path(config["temp_dir"]).mkdir(parents=True, exist_ok=True)
         Path(config["intermediate_dir"]).mkdir(parents=True, exist_ok=True)
@@ -469,59 +635,75 @@ class ParallelAcquisitionCoordinatorNode(Node):
         total_videos = len(video_sources)
         completed = 0
 
-        # Use ProcessPoolExecutor for multiprocessing
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_video = {
+        # Use the shared ProcessPoolExecutor for multiprocessing. One submit per
+        # source (not executor.map with a chunksize): each item is a download or
+        # transcription taking seconds to minutes, so batching saves no
+        # measurable IPC, and ordered/chunked results would hold back per-item
+        # status, progress and cancellation behind the slowest item of a chunk.
+        def submit_all(executor):
+            return {
                 executor.submit(
                     process_single_video_acquisition, video_data, config
                 ): video_data
                 for video_data in video_sources
             }
 
-            # Process completed tasks
-            for future in as_completed(future_to_video):
+        try:
+            future_to_video = submit_all(_get_acquisition_executor(max_workers))
+        except BrokenProcessPool:
+            future_to_video = submit_all(_get_acquisition_executor(max_workers, replace=True))
+
+        pending = set(future_to_video)
+        try:
+            # Process completed tasks; wake up regularly so a stop request is
+            # noticed even while every worker is busy with a long item
+            while pending:
+                done, pending = wait(pending, timeout=_STOP_POLL_SECONDS, return_when=FIRST_COMPLETED)
                 # Check if stop was requested
                 if stop_check():
                     status_callback("Cancelling remaining tasks...", StatusType.WARNING)
-                    # Cancel remaining futures
-                    for remaining_future in future_to_video:
-                        if not remaining_future.done():
-                            remaining_future.cancel()
+                    # Drop all queued work in one call; the next run starts a
+                    # fresh pool
+                    reset_acquisition_pool()
                     break
 
-                video_data = future_to_video[future]
-                video_title = video_data["original_title"]
-
-                try:
-                    result = future.result()
-                    results[video_title] = result
-
-                    if result["status"] == "success":
-                        status_callback(
-                            f"✓ {video_title}: Content acquired successfully",
-                            StatusType.SUCCESS,
-                        )
-                    else:
+                for future in done:
+                    video_data = future_to_video[future]
+                    video_title = video_data["original_title"]
+
+                    try:
+                        result = future.result()
+                        results[video_title] = result
+
+                        if result["status"] == "success":
+                            status_callback(
+                                f"✓ {video_title}: Content acquired successfully",
+                                StatusType.SUCCESS,
+                            )
+                        else:
+                            status_callback(
+                                f"✗ {video_title}: {result['error']}", StatusType.ERROR
+                            )
+
+                    except Exception as e:
+                        results[video_title] = {
+                            "status": "failure",
+                            "video_title": video_title,
+                            "transcript_file": None,
+                            "transcript_text": None,
+                            "error": str(e),
+                        }
                         status_callback(
-                            f"✗ {video_title}: {result['error']}", StatusType.ERROR
+                            f"✗ {video_title}: Exception - {str(e)}", StatusType.ERROR
                         )
 
-                except Exception as e:
-                    results[video_title] = {
-                        "status": "failure",
-                        "video_title": video_title,
-                        "transcript_file": None,
-                        "transcript_text": None,
-                        "error": str(e),
-                    }
-                    status_callback(
-                        f"✗ {video_title}: Exception - {str(e)}", StatusType.ERROR
-                    )
-
-                completed += 1
-                progress_percent = int((completed / total_videos) * 100)
-                progress_callback(progress_percent)
+                    completed += 1
+                    progress_percent = int((completed / total_videos) * 100)
+                    progress_callback(progress_percent)
+        finally:
+            # Queued tasks were dropped above; let in-flight ones finish as
+            # the old per-run pool did on shutdown.
+            wait(future_to_video)
 
         # Summary
         if stop_check():
@@ -539,18 +721,17 @@ class ParallelAcquisitionCoordinatorNode(Node):
         return results
 
     def post(self, shared, prep_res, exec_res):
-        shared["phase_1_results"] = exec_res
+        shared.phase_1_results = exec_res
 
         # Collect transcript files and (for CSV) transcript_file -> job_id mapping
-        transcript_files = []
-        transcript_file_to_job_id = {}
-        for result in exec_res.values():
-            if result["status"] == "success" and result["transcript_file"]:
-                transcript_files.append(result["transcript_file"])
-                transcript_file_to_job_id[result["transcript_file"]] = result.get("job_id", 0)
+        transcript_file_to_job_id = {
+            result["transcript_file"]: result.get("job_id", 0)
+            for result in exec_res.values()
+            if result["status"] == "success" and result["transcript_file"]
+        }
 
-        shared["raw_transcript_files"] = transcript_files
-        shared["transcript_file_to_job_id"] = transcript_file_to_job_id
+        shared.raw_transcript_files = list(transcript_file_to_job_id)
+        shared.transcript_file_to_job_id = transcript_file_to_job_id
         return "phase_1_complete"
 
 
@@ -560,31 +741,38 @@ class RefinementTaskCreatorNode(Node):
     """
 
     def prep(self, shared):
-        should_discover = shared.get("phase_2_only", False) or shared.get(
-            "resume_mode", False
-        )
+        should_discover = shared.phase_2_only or shared.resume_mode
 
         if should_discover:
-            transcript_files = discover_raw_transcript_files(shared["intermediate_dir"])
+            transcript_files = discover_raw_transcript_files(shared.intermediate_dir)
         else:
-            transcript_files = shared.get("raw_transcript_files", [])
+            transcript_files = shared.raw_transcript_files
 
         return {
             "transcript_files": transcript_files,
-            "selected_styles_data": shared["selected_styles_data"],
-            "output_base_dir": shared["output_base_dir"],
-            "output_language": shared.get("output_language", "English"),
-            "transcript_file_to_job_id": shared.get("transcript_file_to_job_id", {}),
-            "job_overrides": shared.get("job_overrides", {}),
-            "status_callback": shared["status_update_callback"],
-            "phase_2_only": shared.get("phase_2_only", False),
-            "resume_mode": shared.get("resume_mode", False),
-            "phase2_skip_existing": shared.get("phase2_skip_existing", False),
+            "selected_styles_data": shared.selected_styles_data,
+            "output_base_dir": shared.output_base_dir,
+            "output_language": shared.output_language,
+            "transcript_file_to_job_id": shared.transcript_file_to_job_id,
+            "job_overrides": shared.job_overrides,
+            "status_callback": shared.status_update_callback,
+            "phase_2_only": shared.phase_2_only,
+            "resume_mode": shared.resume_mode,
+            "phase2_skip_existing": shared.phase2_skip_existing,
+            "phase2_model_id": _phase2_model_id(shared),
+            "llm_chunk_size": shared.llm_chunk_size,
+            "metadata_enhancement_enabled": shared.metadata_enhancement_enabled,
+            "metadata_llm_model": shared.metadata_llm_model,
         }
 
     def exec(self, prep_data):
         from collections import defaultdict
-        import os
+
+        from utils.llm_refiner import (
+            create_refinement_tasks,
+            is_refinement_current,
+            refinement_digest,
+        )
 
         status_callback = prep_data["status_callback"]
         transcript_files = prep_data["transcript_files"]
@@ -616,6 +804,7 @@ class RefinementTaskCreatorNode(Node):
 
         # CSV batch: group by job_id and use per-job styles/output_subdir when present
         if transcript_file_to_job_id and job_overrides:
+            from utils.csv_batch import JobOverride
             from .prompts import text_refinement_prompts
 
             by_job = defaultdict(list)
@@ -625,22 +814,24 @@ class RefinementTaskCreatorNode(Node):
 
             tasks = []
             default_lang = prep_data.get("output_language") or "English"
+            default_styles = prep_data["selected_styles_data"]
+            default_overrides = JobOverride()
+            prompts = text_refinement_prompts
+            output_dirs = {"": output_base_dir}  # output_subdir -> output folder
             for job_id, files in by_job.items():
-                overrides = job_overrides.get(job_id, {})
-                style_names = overrides.get("styles")
+                overrides = job_overrides.get(job_id, default_overrides)
+                style_names = overrides.styles
                 if style_names:
-                    styles_data = [
-                        (n, text_refinement_prompts[n])
-                        for n in style_names
-                        if n in text_refinement_prompts
-                    ]
+                    styles_data = [(n, p) for n in style_names if (p := prompts.get(n)) is not None]
                 else:
-                    styles_data = prep_data["selected_styles_data"]
+                    styles_data = default_styles
                 if not styles_data:
                     continue
-                subdir = overrides.get("output_subdir") or ""
-                output_dir = os.path.join(output_base_dir, subdir) if subdir else output_base_dir
-                job_lang = overrides.get("language") or default_lang
+                subdir = overrides.output_subdir or ""
+                output_dir = output_dirs.get(subdir)
+                if output_dir is None:
+                    output_dir = output_dirs[subdir] = os.path.join(output_base_dir, subdir)
+                job_lang = overrides.language or default_lang
                 tasks.extend(
                     create_refinement_tasks(files, styles_data, output_dir, language=job_lang)
                 )
@@ -662,6 +853,38 @@ class RefinementTaskCreatorNode(Node):
                     StatusType.INFO,
                 )
 
+        # Tag each task with a digest of its inputs (written next to the output
+        # on success). On a resume / Phase 2 only re-run, outputs made from the
+        # same transcript, style, language and Phase 2 settings are not refined
+        # again, even with "Existing .md" unchecked.
+        if tasks:
+            default_lang = prep_data.get("output_language") or "English"
+            metadata_enhanced = prep_data["metadata_enhancement_enabled"]
+            settings = (
+                prep_data["phase2_model_id"],
+                prep_data["llm_chunk_size"],
+                metadata_enhanced,
+                prep_data["metadata_llm_model"] if metadata_enhanced else None,
+            )
+            pending = []
+            for task in tasks:
+                try:
+                    digest = refinement_digest(task, default_lang, settings)
+                except OSError:  # unreadable transcript: let refinement report it
+                    pending.append(task)
+                    continue
+                if (phase_2_only or resume_mode) and is_refinement_current(task, digest):
+                    continue
+                task["input_digest"] = digest
+                pending.append(task)
+            unchanged = len(tasks) - len(pending)
+            tasks = pending
+            if unchanged > 0:
+                status_callback(
+                    f"Skipped {unchanged} task(s) already refined from unchanged inputs",
+                    StatusType.INFO,
+                )
+
         status_callback(
             f"Created {len(tasks)} refinement tasks",
             StatusType.SUCCESS,
@@ -670,7 +893,7 @@ class RefinementTaskCreatorNode(Node):
         return tasks
 
     def post(self, shared, prep_res, exec_res):
-        shared["refinement_tasks"] = exec_res
+        shared.refinement_tasks = exec_res
 
         if exec_res:
             return "start_async_refinement"
@@ -684,16 +907,16 @@ class AsyncRefinementCoordinatorNode(Node):
     """
 
     def prep(self, shared):
-        phase2_model_id = shared.get("phase2_model_id") or shared.get("selected_gemini_model") or "zai/glm-7-flash"
+        phase2_model_id = _phase2_model_id(shared)
         phase2_entry = get_model_by_id(phase2_model_id, "phase2")
         provider_config = None
         if phase2_entry:
             prov = phase2_entry.get("provider", "zai")
             key_map = {
-                "gemini": shared.get("gemini_api_key"),
-                "openai": shared.get("openai_api_key"),
-                "deepseek": shared.get("deepseek_api_key"),
-                "zai": shared.get("zai_api_key"),
+                "gemini": shared.gemini_api_key,
+                "openai": shared.openai_api_key,
+                "deepseek": shared.deepseek_api_key,
+                "zai": shared.zai_api_key,
             }
             provider_config = {
                 "provider": prov,
@@ -701,23 +924,23 @@ class AsyncRefinementCoordinatorNode(Node):
                 "api_key": key_map.get(prov),
             }
         return {
-            "refinement_tasks": shared["refinement_tasks"],
-            "max_workers_async": shared["max_workers_async"],
+            "refinement_tasks": shared.refinement_tasks,
+            "max_workers_async": shared.max_workers_async,
             "gemini_config": {
-                "api_key": shared["gemini_api_key"],
-                "model_name": shared.get("selected_gemini_model"),
+                "api_key": shared.gemini_api_key,
+                "model_name": shared.selected_gemini_model,
                 "phase2_model_id": phase2_model_id,
                 "provider_config": provider_config,
-                "chunk_size": shared["llm_chunk_size"],
-                "language": shared["output_language"],
-                "intermediate_dir": shared["intermediate_dir"],
-                "metadata_enhancement_enabled": shared.get("metadata_enhancement_enabled", True),
-                "openai_api_key": shared.get("openai_api_key"),
-                "metadata_llm_model": shared.get("metadata_llm_model", "gpt-5-nano"),
+                "chunk_size": shared.llm_chunk_size,
+                "language": shared.output_language,
+                "intermediate_dir": shared.intermediate_dir,
+                "metadata_enhancement_enabled": shared.metadata_enhancement_enabled,
+                "openai_api_key": shared.openai_api_key,
+                "metadata_llm_model": shared.metadata_llm_model,
             },
-            "status_callback": shared["status_update_callback"],
-            "progress_callback": shared["progress_update_callback"],
-            "stop_check_callback": shared.get("stop_check_callback", lambda: False),
+            "status_callback": shared.status_update_callback,
+            "progress_callback": shared.progress_update_callback,
+            "stop_check_callback": _stop_check(shared),
         }
 
     def exec(self, prep_data):
@@ -736,7 +959,7 @@ class AsyncRefinementCoordinatorNode(Node):
         status_callback("Starting async refinement processing...", StatusType.INFO)
 
         # Run async processing
-        results = asyncio.run(
+        results = _get_refinement_loop().run_until_complete(
             self._process_refinement_tasks_async(
                 tasks, max_workers, gemini_config, status_callback, progress_callback, stop_check
             )
@@ -762,6 +985,8 @@ class AsyncRefinementCoordinatorNode(Node):
         self, tasks, max_workers, gemini_config, status_callback, progress_callback, stop_check
     ):
         """Async helper method to process refinement tasks concurrently."""
+        from utils.llm_refiner import async_refine_single_task
+
         semaphore = asyncio.Semaphore(max_workers)
         results = {}
         total_tasks = len(tasks)
@@ -832,7 +1057,7 @@ class AsyncRefinementCoordinatorNode(Node):
         return results
 
     def post(self, shared, prep_res, exec_res):
-        shared["phase_2_results"] = exec_res
+        shared.phase_2_results = exec_res
 
         # Build final outputs summary
         final_outputs = []
@@ -846,7 +1071,7 @@ class AsyncRefinementCoordinatorNode(Node):
                 }
             )
 
-        shared["final_outputs_summary"] = final_outputs
+        shared.final_outputs_summary = final_outputs
         return "phase_2_complete"
 
 
@@ -857,8 +1082,8 @@ class TempFileCleanupNode(Node):
 
     def prep(self, shared):
         return {
-            "temp_dir": shared["temp_dir"],
-            "status_callback": shared["status_update_callback"],
+            "temp_dir": shared.temp_dir,
+            "status_callback": shared.status_update_callback,
         }
 
     def exec(self, prep_data):
@@ -884,12 +1109,12 @@ class FlowCompletionNode(Node):
 
     def prep(self, shared):
         return {
-            "final_outputs_summary": shared.get("final_outputs_summary", []),
-            "phase_1_results": shared.get("phase_1_results", {}),
-            "phase_2_results": shared.get("phase_2_results", {}),
-            "run_phase_1": shared.get("run_phase_1", False),
-            "run_phase_2": shared.get("run_phase_2", False),
-            "status_callback": shared["status_update_callback"],
+            "final_outputs_summary": shared.final_outputs_summary,
+            "phase_1_results": shared.phase_1_results,
+            "phase_2_results": shared.phase_2_results,
+            "run_phase_1": shared.run_phase_1,
+            "run_phase_2": shared.run_phase_2,
+            "status_callback": shared.status_update_callback,
         }
 
     def exec(self, prep_data):
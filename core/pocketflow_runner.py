@@ -3,29 +3,27 @@ PocketFlow runner thread for BodhiFlow.
 
 Runs the PocketFlow in a QThread so the GUI stays responsive.
 Import from here instead of main.pyw for cross-platform stability (.pyw is not
-importable as a module on many platforms).
+importable as a module on many platforms). The project root must already be on
+sys.path (main.pyw puts it there), as for every other core/ module.
 """
 
 import logging
 import os
-import sys
-from pathlib import Path
+import threading
 
-from PyQt5.QtCore import QThread, pyqtSignal
-
-# Allow imports from project root when run as script or from main.pyw
-if __name__ != "__main__":
-    _root = Path(__file__).resolve().parent.parent
-    if str(_root) not in sys.path:
-        sys.path.insert(0, str(_root))
+from PyQt5.QtCore import QThread, QTimer, pyqtSignal
 
 from .flow import create_flow_for_phases
+from .shared_memory import SharedMemory, flow_param_defaults
 from utils.constants import StatusType, STATUS_TO_LOG_LEVEL
 from utils.logger_config import get_logger
 from utils.models_config import get_asr_model_max_concurrency
 
 logger = get_logger(__name__)
 
+# How often buffered progress is forwarded to the GUI (~15 updates/s).
+_PROGRESS_FLUSH_INTERVAL_MS = 66
+
 
 def _capped_phase1_workers(requested: int, asr_model_id: str | None) -> int:
     """Cap Phase 1 parallel workers by ASR model max_concurrency (e.g. ZAI GLM-ASR-2512 allows 5)."""
@@ -43,6 +41,10 @@ class PocketFlowRunner(QThread):
         status_update: Emitted when a status message needs to be displayed
         progress_update: Emitted when progress percentage changes
         flow_complete: Emitted when the entire flow is finished
+
+    Nodes (and any threads they start) reach the GUI only through the shared
+    status/progress callbacks, which emit these signals; they never touch
+    widgets directly. The window connects them with Qt.QueuedConnection.
     """
 
     status_update = pyqtSignal(str, object)  # (message, StatusType)
@@ -52,121 +54,103 @@ class PocketFlowRunner(QThread):
     def __init__(self, flow_params):
         super().__init__()
         self.flow_params = flow_params
-        self._stop_requested = False
+        # Defaults are merged (and the Phase 1 worker count capped) here on the
+        # GUI thread, so the worker only adds callbacks and the CSV batch.
+        self._merged_params = {k: flow_params.get(k, d) for k, d in flow_param_defaults().items()}
+        self._merged_params["max_workers_processes"] = _capped_phase1_workers(
+            self._merged_params["max_workers_processes"], self._merged_params["asr_model_id"]
+        )
+        self._stop_event = threading.Event()
+
+        # Progress is buffered here by the worker and forwarded at a fixed
+        # rate. The timer belongs to the GUI thread (the worker runs the flow
+        # synchronously and has no event loop), so it fires there.
+        self._latest_progress: int | None = None
+        self._emitted_progress: int | None = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(_PROGRESS_FLUSH_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        self.started.connect(self._progress_timer.start)
+        self.finished.connect(self._progress_timer.stop)
 
     def stop(self):
         """Request the thread to stop processing."""
-        self._stop_requested = True
+        self._stop_event.set()
         self.status_update.emit("Cancellation requested...", StatusType.WARNING)
 
     def run(self):
         """Execute the PocketFlow in this worker thread."""
+        # Keep the coordinator responsive to its pool/IO completions while the
+        # GUI thread is busy repainting.
+        self.setPriority(QThread.HighPriority)
         try:
             shared_memory = self._initialize_shared_memory()
-            shared_memory["stop_check_callback"] = self._check_stop_requested
+            shared_memory.stop_event = self._stop_event
+            shared_memory.stop_check_callback = self._stop_event.is_set
 
             flow = create_flow_for_phases(
-                shared_memory["run_phase_1"], shared_memory["run_phase_2"]
+                shared_memory.run_phase_1, shared_memory.run_phase_2
             )
             flow.run(shared_memory)
+            self._flush_progress()
 
-            if not self._stop_requested:
+            if not self._stop_event.is_set():
                 self.flow_complete.emit()
             else:
                 self.status_update.emit("Processing cancelled by user", StatusType.WARNING)
 
         except Exception as e:
-            if not self._stop_requested:
+            if not self._stop_event.is_set():
                 self.status_update.emit(f"Flow execution error: {str(e)}", StatusType.ERROR)
 
-    def _check_stop_requested(self):
-        """Check if stop has been requested. Returns True if should stop."""
-        return self._stop_requested
+    def _flush_progress(self):
+        """Emit the latest buffered progress value if it changed since the last emit."""
+        value = self._latest_progress
+        if value is not None and value != self._emitted_progress:
+            self._emitted_progress = value
+            self.progress_update.emit(value)
 
     def _initialize_shared_memory(self):
-        """Initialize shared memory structure from GUI flow_params."""
-        status_type_to_log_level = STATUS_TO_LOG_LEVEL
+        """Build the SharedMemory for this run from GUI flow_params."""
+        emit_status = self.status_update.emit
+        _get_level = STATUS_TO_LOG_LEVEL.get
+        _log = logger.log
+        _enabled = logger.isEnabledFor
 
         def status_callback(message: str, msg_type: StatusType):
-            self.status_update.emit(message, msg_type)
-            log_level = status_type_to_log_level.get(msg_type, logging.INFO)
-            logger.log(log_level, f"[GUI] {message}")
+            emit_status(message, msg_type)
+            log_level = _get_level(msg_type, logging.INFO)
+            if _enabled(log_level):
+                _log(log_level, "[GUI] %s", message)
 
         def progress_callback(progress_percent: int):
-            self.progress_update.emit(progress_percent)
-            logger.debug(f"[GUI] Progress: {progress_percent}%")
+            self._latest_progress = progress_percent
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[GUI] Progress: %d%%", progress_percent)
 
         csv_path = self.flow_params.get("csv_path")
         csv_jobs = []
         job_overrides = {}
         if csv_path and os.path.isfile(csv_path):
+            # Already off the GUI thread; report before parsing so the status
+            # display updates immediately even when the CSV sits on a slow share.
+            status_callback("Reading CSV batch...", StatusType.INFO)
             try:
-                from utils.csv_batch import parse_bodhiflow_csv
+                from utils.csv_batch import JobOverride, parse_bodhiflow_csv
                 csv_jobs = parse_bodhiflow_csv(csv_path)
                 job_overrides = {
-                    j["job_id"]: {
-                        "styles": j["styles"],
-                        "language": j["language"],
-                        "output_subdir": j["output_subdir"],
-                    }
+                    j["job_id"]: JobOverride(j["styles"], j["language"], j["output_subdir"])
                     for j in csv_jobs
                 }
             except (ValueError, FileNotFoundError) as e:
-                logger.error(f"CSV parse failed: {e}")
-
-        shared_memory = {
-            "user_input_path": self.flow_params.get("user_input_path"),
-            "input_mode_hint": self.flow_params.get("input_mode_hint"),
-            "document_folder_recursive": self.flow_params.get("document_folder_recursive", True),
-            "csv_path": csv_path,
-            "csv_jobs": csv_jobs,
-            "job_overrides": job_overrides,
-            "cookie_file_path": self.flow_params.get("cookie_file_path"),
-            "selected_styles_data": self.flow_params.get("selected_styles_data", []),
-            "output_language": self.flow_params.get("output_language", "English"),
-            "gemini_api_key": self.flow_params.get("gemini_api_key"),
-            "openai_api_key": self.flow_params.get("openai_api_key"),
-            "zai_api_key": self.flow_params.get("zai_api_key"),
-            "deepseek_api_key": self.flow_params.get("deepseek_api_key"),
-            "asr_model_id": self.flow_params.get("asr_model_id"),
-            "phase2_model_id": self.flow_params.get("phase2_model_id"),
-            "output_base_dir": self.flow_params.get("output_base_dir", "./output"),
-            "intermediate_dir": self.flow_params.get(
-                "intermediate_dir", "./intermediate_transcripts"
-            ),
-            "temp_dir": self.flow_params.get("temp_dir", "./temp_bodhiflow"),
-            "start_index": self.flow_params.get("start_index", 1),
-            "end_index": self.flow_params.get("end_index", 0),
-            "llm_chunk_size": self.flow_params.get("llm_chunk_size", 70000),
-            "resume_mode": self.flow_params.get("resume_mode", False),
-            "phase2_skip_existing": self.flow_params.get("phase2_skip_existing", False),
-            "disable_ai_transcribe": self.flow_params.get("disable_ai_transcribe", False),
-            "save_video_on_ai_transcribe": self.flow_params.get("save_video_on_ai_transcribe", False),
-            "selected_gemini_model": self.flow_params.get(
-                "selected_gemini_model", "gemini-2.5-flash"
-            ),
-            "metadata_enhancement_enabled": self.flow_params.get(
-                "metadata_enhancement_enabled", True
-            ),
-            "metadata_llm_model": self.flow_params.get(
-                "metadata_llm_model", "gpt-5-nano"
-            ),
-            "run_phase_1": self.flow_params.get("run_phase_1", True),
-            "run_phase_2": self.flow_params.get("run_phase_2", True),
-            "phase_1_only": self.flow_params.get("phase_1_only", False),
-            "phase_2_only": self.flow_params.get("phase_2_only", False),
-            "max_workers_processes": _capped_phase1_workers(
-                self.flow_params.get("max_workers_processes", 4),
-                self.flow_params.get("asr_model_id"),
-            ),
-            "max_workers_async": self.flow_params.get("max_workers_async", 10),
-            "status_update_callback": status_callback,
-            "progress_update_callback": progress_callback,
-            "video_sources_queue": [],
-            "raw_transcript_files": [],
-            "phase_1_results": {},
-            "refinement_tasks": [],
-            "phase_2_results": {},
-            "final_outputs_summary": [],
-        }
+                logger.error("CSV parse failed: %s", e)
+
+        shared_memory = SharedMemory(
+            **self._merged_params,
+            csv_path=csv_path,
+            csv_jobs=csv_jobs,
+            job_overrides=job_overrides,
+            status_update_callback=status_callback,
+            progress_update_callback=progress_callback,
+        )
         return shared_memory
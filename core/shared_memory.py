@@ -0,0 +1,87 @@
+"""
+Shared run state for BodhiFlow flows.
+
+PocketFlow hands the same ``shared`` object to every node's prep/post; this
+module defines it as a slotted dataclass so nodes read and write typed
+attributes instead of string-keyed dict entries.
+"""
+
+import threading
+from dataclasses import MISSING, dataclass, field, fields
+from typing import Any, Callable
+
+
+def _flow_param(default: Any = MISSING, *, default_factory: Any = MISSING) -> Any:
+    """A field copied from the GUI's flow_params; its default applies when the GUI omits it."""
+    return field(default=default, default_factory=default_factory, metadata={"flow_param": True})
+
+
+@dataclass(slots=True)
+class SharedMemory:
+    """State passed through every node of a BodhiFlow run."""
+
+    # Inputs (from the GUI's flow_params; see flow_param_defaults)
+    user_input_path: str | None = _flow_param(None)
+    input_mode_hint: str | None = _flow_param(None)
+    document_folder_recursive: bool = _flow_param(True)
+    cookie_file_path: str | None = _flow_param(None)
+    selected_styles_data: list[dict[str, Any]] = _flow_param(default_factory=list)
+    output_language: str = _flow_param("English")
+    gemini_api_key: str | None = _flow_param(None)
+    openai_api_key: str | None = _flow_param(None)
+    zai_api_key: str | None = _flow_param(None)
+    deepseek_api_key: str | None = _flow_param(None)
+    asr_model_id: str | None = _flow_param(None)
+    phase2_model_id: str | None = _flow_param(None)
+    output_base_dir: str = _flow_param("./output")
+    intermediate_dir: str = _flow_param("./intermediate_transcripts")
+    temp_dir: str = _flow_param("./temp_bodhiflow")
+    start_index: int = _flow_param(1)
+    end_index: int = _flow_param(0)
+    llm_chunk_size: int = _flow_param(70000)
+    resume_mode: bool = _flow_param(False)
+    phase2_skip_existing: bool = _flow_param(False)
+    disable_ai_transcribe: bool = _flow_param(False)
+    save_video_on_ai_transcribe: bool = _flow_param(False)
+    selected_gemini_model: str = _flow_param("gemini-2.5-flash")
+    metadata_enhancement_enabled: bool = _flow_param(True)
+    metadata_llm_model: str = _flow_param("gpt-5-nano")
+    run_phase_1: bool = _flow_param(True)
+    run_phase_2: bool = _flow_param(True)
+    phase_1_only: bool = _flow_param(False)
+    phase_2_only: bool = _flow_param(False)
+    max_workers_processes: int = _flow_param(4)
+    max_workers_async: int = _flow_param(10)
+
+    # CSV batch
+    csv_path: str | None = None
+    csv_jobs: list[dict[str, Any]] = field(default_factory=list)
+    job_overrides: dict[str, Any] = field(default_factory=dict)
+
+    # Runner hooks
+    status_update_callback: Callable[[str, Any], None] | None = None
+    progress_update_callback: Callable[[int], None] | None = None
+    stop_check_callback: Callable[[], bool] | None = None
+    stop_event: threading.Event | None = None  # preferred over stop_check_callback when set
+
+    # Filled in by nodes as the flow runs
+    video_sources_queue: list[dict[str, Any]] = field(default_factory=list)
+    raw_transcript_files: list[str] = field(default_factory=list)
+    transcript_file_to_job_id: dict[str, int] = field(default_factory=dict)
+    phase_1_results: dict[str, Any] = field(default_factory=dict)
+    refinement_tasks: list[dict[str, Any]] = field(default_factory=list)
+    phase_2_results: dict[str, Any] = field(default_factory=dict)
+    final_outputs_summary: list[dict[str, Any]] = field(default_factory=list)
+
+
+def flow_param_defaults() -> dict[str, Any]:
+    """
+    {name: default} for every SharedMemory input supplied via flow_params, read
+    from the field definitions. Default factories are called, so each call
+    returns fresh containers.
+    """
+    return {
+        f.name: f.default_factory() if f.default is MISSING else f.default
+        for f in fields(SharedMemory)
+        if f.metadata.get("flow_param")
+    }
@@ -26,9 +26,21 @@ Requirements:
 
 import logging
 import os
-
-from dotenv import load_dotenv
-from PyQt5.QtCore import QFile, Qt, QTextStream, QThread, pyqtSignal, pyqtSlot
+import stat
+from collections import deque
+
+from PyQt5.QtCore import (
+    QObject,
+    QRunnable,
+    QSignalBlocker,
+    Qt,
+    QThread,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+    pyqtSlot,
+)
+from PyQt5.QtGui import QTextCursor
 from PyQt5.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -49,16 +61,9 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
-from core.prompts import text_refinement_prompts
+# Prompts, UI/model config and dotenv are imported where first used, so that
+# importing this module only loads Qt and the logger.
 from utils.logger_config import get_logger
-from utils.ui_config import get_ui_config
-from utils.models_config import (
-    get_asr_models,
-    get_phase2_models,
-    get_default_asr_id,
-    get_default_phase2_id,
-    get_phase2_model_max_concurrency,
-)
 
 # Initialize logger for this module
 gui_logger = get_logger(__name__)
@@ -70,7 +75,226 @@ from utils.constants import StatusType, STATUS_COLORS, STATUS_TO_LOG_LEVEL
 # Alias for backward compatibility (GUI-specific usage)
 GUI_STATUS_TO_LOG_LEVEL = STATUS_TO_LOG_LEVEL
 
-load_dotenv(".env")  # This might need adjustment based on BodhiFlow's .env location
+# Status line HTML per StatusType; "{}" takes the message
+_STATUS_HTML = {
+    t: f"<font color='{STATUS_COLORS.get(t, STATUS_COLORS[StatusType.INFO])}'>{{}}</font>" for t in StatusType
+}
+
+# Qt enum values used while building the UI, resolved once
+_WA_ALWAYS = Qt.WA_AlwaysShowToolTips
+_ALIGN_CENTER = Qt.AlignCenter
+_ALIGN_TOP = Qt.AlignTop
+_ALIGN_TL = Qt.AlignLeft | Qt.AlignTop
+_HORIZ = Qt.Horizontal
+_PWD = QLineEdit.Password
+
+# File dialog flags: skip per-entry custom icon probes (and symlink resolution
+# for folder pickers), which stall the dialog on network mounts and large folders
+_DIR_DIALOG_OPTIONS = (
+    QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks | QFileDialog.DontUseCustomDirectoryIcons
+)
+_FILE_DIALOG_OPTIONS = QFileDialog.Options(QFileDialog.DontUseCustomDirectoryIcons)
+_FILTER_TXT = "Text Files (*.txt);;All Files (*)"
+_FILTER_CSV = "CSV (*.csv);;All Files (*)"
+
+_STATUS_MAX_BLOCKS = 5000  # lines kept in the status log
+
+# get_input_type() results accepted for a single input; the local ones must also exist on disk
+_LOCAL_INPUT_TYPES = frozenset({"file", "folder", "text_file", "pdf_file", "word_file", "document_folder"})
+_VALID_INPUT_TYPES = _LOCAL_INPUT_TYPES | {
+    "youtube_video_url",
+    "youtube_playlist_url",
+    "teams_meeting_url",
+    "podcast_rss_url",
+    "webpage_url",
+}
+
+
+def _tip(widget, text, always=True):
+    """Set a widget's tooltip; by default also show it while the window is inactive."""
+    widget.setToolTip(text)
+    if always:
+        widget.setAttribute(_WA_ALWAYS, True)
+
+
+def _stat_kind(path):
+    """'f' for a regular file, 'd' for a directory, else None - from a single os.stat()."""
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        return None
+    if stat.S_ISREG(mode):
+        return "f"
+    if stat.S_ISDIR(mode):
+        return "d"
+    return None
+
+
+# Options grid: (attribute, label, ui_config["options"] key, object name,
+# role property, row, column, tooltip).
+# Row 0: Batch CSV, Resume from Last Run, Save Video
+# Row 1: Metadata, Disable AI Audio Transcribe, 🔒Existing .md
+_OPTION_CHECKBOXES = (
+    (
+        "batch_checkbox", "Batch CSV", "batch_csv", None, None, 0, 0,
+        "Run multiple jobs from a CSV file; check to show CSV path and select file.",
+    ),
+    (
+        "resume_checkbox", "Resume from Last Run", "resume", "ResumeCheckbox", "option", 0, 1,
+        "Skip items that already have a transcript in the Intermediate folder; retry only failed or new items.\n"
+        "Phase 2 also skips outputs refined from the same transcript, style and settings "
+        "(recorded in a .md.hash file next to each output).",
+    ),
+    (
+        "save_video_checkbox", "Save Video", "save_video", "SaveVideoCheckbox", None, 0, 2,
+        "When enabled, if fallback to AI transcription is used, the downloaded video or audio file "
+        "is moved from temp to the Intermediate Transcript Folder for preservation.",
+    ),
+    (
+        "metadata_enhance_checkbox", "Metadata", "metadata_enhance", None, None, 1, 0,
+        "Enhance missing description/tags via gpt-5-nano",
+    ),
+    (
+        "disable_ai_transcribe_checkbox", "Disable AI Audio Transcribe", "disable_ai_transcribe",
+        "DisableAITranscribeCheckbox", "option", 1, 1,
+        "When enabled, YouTube videos will only use downloaded transcripts.\n"
+        "No AI audio transcription fallback will be used, saving costs.",
+    ),
+    (
+        "phase2_skip_existing_checkbox", "🔒Existing .md", "phase2_skip_existing", None, None, 1, 2,
+        "When re-running: skip Phase 2 refinement for outputs that already exist; do not overwrite.",
+    ),
+)
+
+# API key fields, left to right: (attribute, label, env var, placeholder,
+# label object name, label tooltip). Each field is prefilled from its env var.
+_API_KEY_INPUTS = (
+    (
+        "gemini_api_key_input", "Gemini API Key:", "GEMINI_API_KEY", "Enter your Gemini API key", "ApiKeyLabel",
+        "Google Gemini API key for Phase 2 refinement. Get one at Google AI Studio.",
+    ),
+    (
+        "zai_api_key_input", "ZAI API Key:", "ZAI_API_KEY", "Enter your ZAI API key", "ApiKeyLabel",
+        "ZAI (Zhipu) API key for Phase 2 refinement. Optional if using Gemini.",
+    ),
+    (
+        "openai_api_key_input", "OpenAI API Key (for STT):", "OPENAI_API_KEY", "Enter your OpenAI API key for STT",
+        "OpenAiApiKeyLabel",
+        "OpenAI API key for speech-to-text (ASR) when captions are unavailable. Optional.",
+    ),
+    (
+        "deepseek_api_key_input", "DeepSeek API Key:", "DEEPSEEK_API_KEY", "Enter your DeepSeek API key", "ApiKeyLabel",
+        "DeepSeek API key for Phase 2 refinement. Optional if using Gemini or ZAI.",
+    ),
+)
+
+# Display names for models_config provider ids, used in API key messages
+_PROVIDER_NAMES = {"openai": "OpenAI", "zai": "ZAI", "gemini": "Gemini", "deepseek": "DeepSeek"}
+# models_config provider id -> API key field
+_PROVIDER_KEY_FIELDS = {
+    "openai": "openai_api_key_input",
+    "zai": "zai_api_key_input",
+    "gemini": "gemini_api_key_input",
+    "deepseek": "deepseek_api_key_input",
+}
+
+# QLineEdits read (stripped) by validate_inputs and start_processing_flow
+_TEXT_FIELDS = (
+    "url_input",
+    "intermediate_dir_input",
+    "cookie_file_input",
+    "summary_output_dir_input",
+    "gemini_api_key_input",
+    "zai_api_key_input",
+    "openai_api_key_input",
+    "deepseek_api_key_input",
+    "language_input",
+    "start_index_input",
+    "end_index_input",
+)
+
+_ENV_LOADED = False
+# API key env var -> value, read once by _ensure_env() (after .env is applied)
+_ENV_KEYS = {}
+
+
+class _CsvValidationSignals(QObject):
+    validated = pyqtSignal(str, bool, str)  # (csv path, ok, error message)
+
+
+class CsvValidationTask(QRunnable):
+    """
+    Parses a batch CSV on a QThreadPool thread and reports the result via
+    signals.validated, tagged with the path it checked.
+    """
+
+    def __init__(self, csv_path):
+        super().__init__()
+        self.csv_path = csv_path
+        self.signals = _CsvValidationSignals()
+
+    def run(self):
+        from utils.csv_batch import parse_bodhiflow_csv
+
+        try:
+            parse_bodhiflow_csv(self.csv_path)
+        except Exception as e:  # always answer, or the Start button stays disabled
+            self.signals.validated.emit(self.csv_path, False, str(e))
+            return
+        self.signals.validated.emit(self.csv_path, True, "")
+
+
+class _RunnerJoinSignals(QObject):
+    joined = pyqtSignal()
+
+
+class RunnerJoinTask(QRunnable):
+    """Waits for a terminated runner thread on a QThreadPool thread and reports via signals.joined."""
+
+    def __init__(self, thread):
+        super().__init__()
+        self.thread = thread
+        self.signals = _RunnerJoinSignals()
+
+    def run(self):
+        self.thread.wait()
+        self.signals.joined.emit()
+
+
+class LazyComboBox(QComboBox):
+    """QComboBox that calls populate_cb to fill its items the first time they are needed."""
+
+    def __init__(self, populate_cb, parent=None):
+        super().__init__(parent)
+        self._populate_cb = populate_cb
+        self._loaded = False
+
+    def ensure_loaded(self):
+        if not self._loaded:
+            self._loaded = True
+            self._populate_cb()
+
+    def showPopup(self):
+        self.ensure_loaded()
+        super().showPopup()
+
+
+def _ensure_env():
+    """Load .env into os.environ once and snapshot the API key vars into _ENV_KEYS.
+
+    The marker env var carries over to child processes, which skip the .env parse.
+    """
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    if not os.environ.get("_BODHIFLOW_ENV_LOADED"):
+        from dotenv import load_dotenv
+
+        load_dotenv(".env")  # This might need adjustment based on BodhiFlow's .env location
+        os.environ["_BODHIFLOW_ENV_LOADED"] = "1"
+    environ_get = os.environ.get
+    _ENV_KEYS.update((spec[2], environ_get(spec[2], "")) for spec in _API_KEY_INPUTS)
+    _ENV_LOADED = True
 
 
 class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
@@ -90,15 +314,56 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
     - Text refinement using advanced language models
     """
 
+    _URL_PLACEHOLDER = (
+        "Enter YouTube URL (playlist/video), Teams videomanifest URL, Podcast RSS URL, or local video/folder path"
+    )
+    _URL_DISABLED_TEXT = "No Input Allowed"  # shown in the URL field while Phase 2 Only is checked
+
     def __init__(self):
+        _ensure_env()
         super().__init__()
+
+        from utils.ui_config import get_ui_config
+
         self.ui_config = get_ui_config()
+        # "native_file_dialogs": false in ui_config.json switches to Qt's own dialogs
+        native = self.ui_config["native_file_dialogs"]
+        extra = QFileDialog.Options() if native else QFileDialog.Options(QFileDialog.DontUseNativeDialog)
+        self._dir_dialog_options = _DIR_DIALOG_OPTIONS | extra
+        self._file_dialog_options = _FILE_DIALOG_OPTIONS | extra
+        # Folder/file pickers are created on first use and reused, keeping their model and icon cache
+        self._dir_dialog = None
+        self._file_dialogs = {}  # (name filter, save, default suffix) -> QFileDialog
+        self._last_dir = ""  # folder picked last, where the next folder dialog opens
+        self._error_box = None  # handle_error's message box, created on first error
+        self._error_box_active = False  # True while _error_box is open
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
+        from core.prompts import text_refinement_prompts
+
         self.prompts = text_refinement_prompts  # From prompts.py at project root
         self.extraction_thread = None  # To be replaced by PocketFlow
         self.gemini_thread = None  # To be replaced by PocketFlow
         self.is_processing = False
+        self._url_disabled = False  # True while Phase 2 Only shows _URL_DISABLED_TEXT
+        self.input_mode_hint = None  # "media_folder" | "document_folder" when set by folder buttons
+        self._styled_mode_hint = object()  # input_mode_hint the folder buttons were last styled for
+        self._csv_validation_signals = None  # set while a CsvValidationTask is running
+        self._run_output_dir = None  # output folder of the running flow, for the completion message
+        self._toggleable_buttons = []  # Choose File/Folder buttons, disabled while processing
+        self._last_progress = -1  # last value shown by progress_bar
+        self._pending_progress = None  # latest runner value not yet shown
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._apply_pending_progress)
+
+        # Status lines are queued and written to status_display in one edit per tick
+        self._status_buffer = deque()
+        self._status_flush_timer = QTimer(self)
+        self._status_flush_timer.setSingleShot(True)
+        self._status_flush_timer.setInterval(50)
+        self._status_flush_timer.timeout.connect(self._flush_status)
 
         # These model selection parts might be simplified or driven by PocketFlow config
         self.available_models = [
@@ -107,7 +372,24 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
         ]
         self.selected_model_name = "gemini-2.5-flash"
 
+        # URL edits are handled once typing/pasting pauses, not per keystroke
+        self._url_debounce = QTimer(self)
+        self._url_debounce.setSingleShot(True)
+        self._url_debounce.setInterval(150)
+        self._url_debounce.timeout.connect(self._on_url_input_changed_debounced)
+
+        # Cancel asks the runner to stop and returns; the runner's finished
+        # signal reports the result, or this deadline terminates it
+        self._runner_active = False  # True from runner start until its finished signal arrives
+        self._cancelling = False
+        self._cancel_deadline = QTimer(self)
+        self._cancel_deadline.setSingleShot(True)
+        self._cancel_deadline.setInterval(5000)
+        self._cancel_deadline.timeout.connect(self._on_cancel_deadline)
+        self._runner_join_signals = None  # set while a RunnerJoinTask waits for a terminated runner
+
         self.initUI()
+        self._wire_signals()
 
     @pyqtSlot(int)
     def update_chunk_size_label(self, value):
@@ -125,14 +407,15 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
         Handle Phase 1 Only checkbox toggle.
         """
         if checked:
-            # Uncheck Phase 2 Only (mutual exclusion)
-            self.phase_2_only_checkbox.setChecked(False)
+            # Uncheck Phase 2 Only (mutual exclusion); its slot is not needed
+            # since the URL input is restored right here
+            with QSignalBlocker(self.phase_2_only_checkbox):
+                self.phase_2_only_checkbox.setChecked(False)
             # Reset URL input to normal state if it was disabled
-            if self.url_input.text() == "No Input Allowed":
-                self.url_input.clear()
-                self.url_input.setPlaceholderText(
-                    "Enter YouTube URL (playlist/video), Podcast RSS URL, or local video/folder path"
-                )
+            if self._url_disabled:
+                self._url_disabled = False
+                self._set_url_text("")
+                self.url_input.setPlaceholderText(self._URL_PLACEHOLDER)
             self.url_input.setEnabled(True)
 
     @pyqtSlot(bool)
@@ -141,18 +424,19 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
         Handle Phase 2 Only checkbox toggle.
         """
         if checked:
-            # Uncheck Phase 1 Only (mutual exclusion)
-            self.phase_1_only_checkbox.setChecked(False)
+            # Uncheck Phase 1 Only (mutual exclusion); its slot does nothing on uncheck
+            with QSignalBlocker(self.phase_1_only_checkbox):
+                self.phase_1_only_checkbox.setChecked(False)
             # Disable and clear URL input
-            self.url_input.setText("No Input Allowed")
+            self._set_url_text(self._URL_DISABLED_TEXT)
             self.url_input.setEnabled(False)
+            self._url_disabled = True
         else:
             # Re-enable URL input if unchecked
-            if self.url_input.text() == "No Input Allowed":
-                self.url_input.clear()
-                self.url_input.setPlaceholderText(
-                    "Enter YouTube URL (playlist/video), Podcast RSS URL, or local video/folder path"
-                )
+            if self._url_disabled:
+                self._url_disabled = False
+                self._set_url_text("")
+                self.url_input.setPlaceholderText(self._URL_PLACEHOLDER)
             self.url_input.setEnabled(True)
 
     def initUI(self):
@@ -169,17 +453,25 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
 
         Also applies style settings and layouts to create a modern UI appearance.
         """
+        from utils.models_config import get_default_asr_id, get_default_phase2_id, get_model_by_id
+
+        ui = self.ui_config
+        opts = ui["options"]
+        chunk_cfg = ui["chunk_size"]
+
         self.setWindowTitle("BodhiFlow: Transform Content into Wisdom")
         self.setMinimumSize(900, 850)
+        # Hold repaints while the widget tree is built; re-enabled at the end of initUI
+        self.central_widget.setUpdatesEnabled(False)
 
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(20, 20, 20, 20)
         main_layout.setSpacing(15)
 
         # Title Section
-        title_label = QLabel("BodhiFlow: Content to Wisdom Converter")
-        title_label.setObjectName("TitleLabel")
-        title_label.setAlignment(Qt.AlignCenter)
+        title_label = self._mk_section_label(
+            "BodhiFlow: Content to Wisdom Converter", object_name="TitleLabel", role=None, align=_ALIGN_CENTER
+        )
         main_layout.addWidget(title_label)
 
         # Input Container
@@ -194,93 +486,66 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
 
         # Left side: URL Input + folder type buttons (takes most space)
         url_layout = QVBoxLayout()
-        url_label = QLabel(
-            "Input Source (YouTube | Teams Recording | Podcast | Local File/Folder):"
+        url_label = self._mk_section_label(
+            "Input Source (YouTube | Teams Recording | Podcast | Local File/Folder):",
+            object_name="UrlLabel",
+            tooltip="URL or path: YouTube video/playlist, Teams manifest, Podcast RSS, or local file/folder. Use folder buttons for media or document folders.",
         )
-        url_label.setObjectName("UrlLabel")
-        url_label.setToolTip("URL or path: YouTube video/playlist, Teams manifest, Podcast RSS, or local file/folder. Use folder buttons for media or document folders.")
         self.url_input = QLineEdit()
-        self.url_input.setPlaceholderText(
-            "Enter YouTube URL (playlist/video), Teams videomanifest URL, Podcast RSS URL, or local video/folder path"
-        )
+        self.url_input.setPlaceholderText(self._URL_PLACEHOLDER)
         self.url_input.setToolTip("Paste a URL or path. For batch mode, use the CSV file option instead.")
-        self.input_mode_hint = None  # "media_folder" | "document_folder" when set by folder buttons
-        self.url_input.textChanged.connect(self._on_url_input_changed)
-
-        self.batch_checkbox = QCheckBox("Batch CSV")
-        self.batch_checkbox.setChecked(self.ui_config["options"]["batch_csv"])
-        self.batch_checkbox.setToolTip("Run multiple jobs from a CSV file; check to show CSV path and select file.")
-        self.batch_checkbox.setAttribute(Qt.WA_AlwaysShowToolTips, True)
-        self.batch_checkbox.toggled.connect(self._on_batch_checkbox_changed)
 
         self.csv_path = None  # set when user selects CSV file
-        self.csv_path_display = QLineEdit()
-        self.csv_path_display.setReadOnly(True)
-        self.csv_path_display.setPlaceholderText("No CSV selected")
-        self.csv_path_display.setToolTip("Path to the selected CSV file. Columns: url/path, optional style_ids, language, output_subdir.")
-        self.btn_select_csv = QPushButton("Select CSV File")
-        self.btn_select_csv.setToolTip("Choose a CSV file that lists multiple inputs and optional per-row overrides (styles, language, output subdir).")
-        self.btn_select_csv.setAttribute(Qt.WA_AlwaysShowToolTips, True)
-        self.btn_select_csv.clicked.connect(self._on_select_csv_file)
+        # CSV row widgets are built by _build_csv_row() the first time Batch CSV is checked
+        self.csv_row_container = None
+        self.csv_path_display = None
+        self.btn_select_csv = None
 
         # First row: Input path + Recursive (above folder buttons) + folder buttons
         url_row = QHBoxLayout()
         url_row.addWidget(self.url_input)
         self.document_folder_recursive_checkbox = QCheckBox("Recursive📂🔍")
         self.document_folder_recursive_checkbox.setChecked(
-            self.ui_config["options"]["document_folder_recursive"]
+            opts["document_folder_recursive"]
         )
-        self.document_folder_recursive_checkbox.setToolTip("When selecting a folder (media or documents), include subdirectories (default: on).")
-        self.document_folder_recursive_checkbox.setAttribute(Qt.WA_AlwaysShowToolTips, True)
+        _tip(self.document_folder_recursive_checkbox, "When selecting a folder (media or documents), include subdirectories (default: on).")
         self.document_folder_recursive_checkbox.setVisible(False)  # Shown when media or document folder selected
         url_row.addWidget(self.document_folder_recursive_checkbox)
         self.btn_media_folder = QPushButton(r"📁⟩🎥")
-        self.btn_media_folder.setToolTip("Pick a folder containing video/audio files to process")
+        _tip(self.btn_media_folder, "Pick a folder containing video/audio files to process")
         self.btn_media_folder.setFixedWidth(55)
         self.btn_media_folder.setFixedHeight(30)
-        self.btn_media_folder.setStyleSheet("QPushButton { background-color: #D3D3D3; padding: 2px; }")  # Light gray
-        self.btn_media_folder.setAttribute(Qt.WA_AlwaysShowToolTips, True)
-        self.btn_media_folder.clicked.connect(self._on_select_media_folder)
+        self.btn_media_folder.setProperty("role", "folderPicker")  # Light gray via styles.qss
+        self.btn_media_folder.setProperty("folderActive", False)  # green via styles.qss when True
         self.btn_doc_folder = QPushButton(r"📁⟩📖")
-        self.btn_doc_folder.setToolTip("Pick a folder containing PDF/Word/TXT documents for text extraction")
+        _tip(self.btn_doc_folder, "Pick a folder containing PDF/Word/TXT documents for text extraction")
         self.btn_doc_folder.setFixedWidth(55)
         self.btn_doc_folder.setFixedHeight(30)
-        self.btn_doc_folder.setStyleSheet("QPushButton { background-color: #D3D3D3; padding: 2px; }")  # Light gray
-        self.btn_doc_folder.setAttribute(Qt.WA_AlwaysShowToolTips, True)
-        self.btn_doc_folder.clicked.connect(self._on_select_document_folder)
+        self.btn_doc_folder.setProperty("role", "folderPicker")  # Light gray via styles.qss
+        self.btn_doc_folder.setProperty("folderActive", False)  # green via styles.qss when True
         url_row.addWidget(self.btn_media_folder)
         url_row.addWidget(self.btn_doc_folder)
 
-        csv_row_layout = QHBoxLayout()
-        csv_file_label = QLabel("CSV file:")
-        csv_file_label.setToolTip("Batch input: one row per job. Required columns: url or path. Optional: style_ids, language, output_subdir.")
-        csv_row_layout.addWidget(csv_file_label)
-        csv_row_layout.addWidget(self.csv_path_display)
-        csv_row_layout.addWidget(self.btn_select_csv)
-        csv_row_container = QWidget()
-        csv_row_container.setLayout(csv_row_layout)
-        csv_row_container.setVisible(False)
-        self.csv_row_container = csv_row_container
-
         url_layout.addWidget(url_label)
         url_layout.addSpacing(3)
         url_layout.addLayout(url_row)
-        url_layout.addWidget(csv_row_container)
+        self._url_layout = url_layout  # the CSV row is appended here on demand
         url_and_phase_layout.addLayout(url_layout, 3)  # Takes 3/4 of space
 
         # Right side: Phase Control Checkboxes
         phase_control_layout = QVBoxLayout()
         phase_control_layout.setSpacing(6)
 
-        phase_label = QLabel("Phase Control:")
-        phase_label.setObjectName("PhaseControlLabel")
-        phase_label.setToolTip("Run only Phase 1 (transcripts) or only Phase 2 (refinement from existing transcripts). Default: both.")
+        phase_label = self._mk_section_label(
+            "Phase Control:",
+            object_name="PhaseControlLabel",
+            tooltip="Run only Phase 1 (transcripts) or only Phase 2 (refinement from existing transcripts). Default: both.",
+        )
         phase_control_layout.addWidget(phase_label)
 
         self.phase_1_only_checkbox = QCheckBox("Phase 1: Get Transcripts Only")
         self.phase_1_only_checkbox.setObjectName("Phase1OnlyCheckbox")
         self.phase_1_only_checkbox.setToolTip("Acquire transcripts only; skip refinement. Useful for building a transcript library.")
-        self.phase_1_only_checkbox.toggled.connect(self.on_phase_1_only_toggled)
         phase_control_layout.addWidget(self.phase_1_only_checkbox)
 
         self.phase_2_only_checkbox = QCheckBox(
@@ -288,7 +553,6 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
         )
         self.phase_2_only_checkbox.setObjectName("Phase2OnlyCheckbox")
         self.phase_2_only_checkbox.setToolTip("Refine existing transcripts in the Intermediate folder only; skip Phase 1.")
-        self.phase_2_only_checkbox.toggled.connect(self.on_phase_2_only_toggled)
         phase_control_layout.addWidget(self.phase_2_only_checkbox)
 
         url_and_phase_layout.addLayout(phase_control_layout, 1)  # Takes 1/4 of space
@@ -300,50 +564,49 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
         lang_range_options_layout.setSpacing(10)
 
         # Section 1: Output Language (left side)
-        language_layout = QVBoxLayout()
-        language_layout.setSpacing(6)
-        language_label = QLabel("Output Language:")
-        language_label.setObjectName("LanguageLabel")
-        language_label.setToolTip("Target language for refined output (e.g. English, 简体中文). Used by refinement prompts.")
-        language_label.setAlignment(Qt.AlignTop)  # Align to top for consistent baseline
-        self.language_input = QLineEdit()
-        self.language_input.setPlaceholderText("e.g., English, Spanish, French")
-        self.language_input.setToolTip("Type the desired output language name. Can be overridden per job in CSV batch mode.")
-        # Consider how .env is handled in BodhiFlow project structure
-        self.language_input.setText(self.ui_config["language"])
-        self.language_input.setFixedHeight(32)  # Set fixed height for alignment
-        language_layout.addWidget(language_label)
-        language_layout.addSpacing(3)
-        language_layout.addWidget(self.language_input)
+        language_layout, self.language_input = self._labeled_lineedit(
+            "Output Language:",
+            "e.g., English, Spanish, French",
+            "Type the desired output language name. Can be overridden per job in CSV batch mode.",
+            label_object_name="LanguageLabel",
+            label_tip="Target language for refined output (e.g. English, 简体中文). Used by refinement prompts.",
+            text=ui["language"],
+            fixed_height=32,  # Set fixed height for alignment
+        )
         lang_range_options_layout.addLayout(language_layout)
 
         # Section 2: Video Range (middle)
         index_container = QVBoxLayout()
         index_container.setSpacing(6)
-        index_label = QLabel("Video Range (for Playlists/Folders):")
-        index_label.setObjectName("IndexLabel")
-        index_label.setToolTip("For playlists or media folders: process only items from Start to End index. 0 = all.")
-        index_label.setAlignment(Qt.AlignTop)  # Align to top for consistent baseline
+        index_label = self._mk_section_label(
+            "Video Range (for Playlists/Folders):",
+            object_name="IndexLabel",
+            align=_ALIGN_TOP,  # Align to top for consistent baseline
+            tooltip="For playlists or media folders: process only items from Start to End index. 0 = all.",
+        )
         index_container.addWidget(index_label)
         index_container.addSpacing(3)
 
         # Start/End inputs in a horizontal layout
         start_end_layout = QHBoxLayout()
         start_end_layout.setSpacing(5)
-        start_label = QLabel("Start:")
-        start_label.setObjectName("StartLabel")
-        start_label.setToolTip("First item index (1-based).")
+        start_label = self._mk_section_label(
+            "Start:", object_name="StartLabel", role="subLabel", tooltip="First item index (1-based)."
+        )
         self.start_index_input = QLineEdit()
         self.start_index_input.setPlaceholderText("1")
-        self.start_index_input.setText(self.ui_config["start_index"])
+        self.start_index_input.setText(ui["start_index"])
         self.start_index_input.setFixedWidth(60)
         self.start_index_input.setFixedHeight(32)  # Set fixed height for alignment
-        end_label = QLabel("End (0 for all):")
-        end_label.setObjectName("EndLabel")
-        end_label.setToolTip("Last item index (1-based). Use 0 to process all items.")
+        end_label = self._mk_section_label(
+            "End (0 for all):",
+            object_name="EndLabel",
+            role="subLabel",
+            tooltip="Last item index (1-based). Use 0 to process all items.",
+        )
         self.end_index_input = QLineEdit()
         self.end_index_input.setPlaceholderText("0")
-        self.end_index_input.setText(self.ui_config["end_index"])
+        self.end_index_input.setText(ui["end_index"])
         self.end_index_input.setFixedWidth(60)
         self.end_index_input.setFixedHeight(32)  # Set fixed height for alignment
         start_end_layout.addWidget(start_label)
@@ -357,10 +620,12 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
         # Section 3: Options
         options_container = QVBoxLayout()
         options_container.setSpacing(6)
-        options_label = QLabel("Options:")
-        options_label.setObjectName("PhaseControlLabel")  # Use same ObjectName as Phase Control for consistent styling
-        options_label.setToolTip("Batch CSV, resume, save video, metadata enhancement, and ASR/recursive options.")
-        options_label.setAlignment(Qt.AlignTop)  # Align to top for consistent baseline
+        options_label = self._mk_section_label(
+            "Options:",
+            object_name="PhaseControlLabel",  # Use same ObjectName as Phase Control for consistent styling
+            align=_ALIGN_TOP,  # Align to top for consistent baseline
+            tooltip="Batch CSV, resume, save video, metadata enhancement, and ASR/recursive options.",
+        )
         options_container.addWidget(options_label)
         options_container.addSpacing(3)
 
@@ -371,58 +636,18 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
         options_grid.setColumnStretch(1, 1)
         options_grid.setColumnStretch(2, 1)
         
-        self.metadata_enhance_checkbox = QCheckBox("Metadata")
-        self.metadata_enhance_checkbox.setChecked(
-            self.ui_config["options"]["metadata_enhance"]
-        )
-        self.metadata_enhance_checkbox.setToolTip("Enhance missing description/tags via gpt-5-nano")
-        self.metadata_enhance_checkbox.setAttribute(Qt.WA_AlwaysShowToolTips, True)
-        
-        self.resume_checkbox = QCheckBox("Resume from Last Run")
-        self.resume_checkbox.setObjectName("ResumeCheckbox")
-        self.resume_checkbox.setChecked(self.ui_config["options"]["resume"])
-        self.resume_checkbox.setToolTip("Skip items that already have a transcript in the Intermediate folder; retry only failed or new items.")
-        self.resume_checkbox.setAttribute(Qt.WA_AlwaysShowToolTips, True)
-        
-        self.disable_ai_transcribe_checkbox = QCheckBox("Disable AI Audio Transcribe")
-        self.disable_ai_transcribe_checkbox.setObjectName("DisableAITranscribeCheckbox")
-        self.disable_ai_transcribe_checkbox.setChecked(
-            self.ui_config["options"]["disable_ai_transcribe"]
-        )
-        self.disable_ai_transcribe_checkbox.setToolTip(
-            "When enabled, YouTube videos will only use downloaded transcripts.\n"
-            "No AI audio transcription fallback will be used, saving costs."
-        )
-        self.disable_ai_transcribe_checkbox.setAttribute(Qt.WA_AlwaysShowToolTips, True)
-        
-        self.save_video_checkbox = QCheckBox("Save Video")
-        self.save_video_checkbox.setObjectName("SaveVideoCheckbox")
-        self.save_video_checkbox.setChecked(
-            self.ui_config["options"]["save_video"]
-        )
-        self.save_video_checkbox.setToolTip(
-            "When enabled, if fallback to AI transcription is used, the downloaded video or audio file "
-            "is moved from temp to the Intermediate Transcript Folder for preservation."
-        )
-        self.save_video_checkbox.setAttribute(Qt.WA_AlwaysShowToolTips, True)
-        
-        self.phase2_skip_existing_checkbox = QCheckBox("🔒Existing .md")
-        self.phase2_skip_existing_checkbox.setChecked(
-            self.ui_config["options"]["phase2_skip_existing"]
-        )
-        self.phase2_skip_existing_checkbox.setToolTip("When re-running: skip Phase 2 refinement for outputs that already exist; do not overwrite.")
-        self.phase2_skip_existing_checkbox.setAttribute(Qt.WA_AlwaysShowToolTips, True)
-
-        # Arrange in 2x3 grid:
-        # Row 0: Batch CSV, Resume from Last Run, Save Video
-        # Row 1: Metadata, Disable AI Audio Transcribe, 🔒Existing .md
-        # Set alignment to ensure vertical alignment within columns
-        options_grid.addWidget(self.batch_checkbox, 0, 0, Qt.AlignLeft | Qt.AlignTop)
-        options_grid.addWidget(self.resume_checkbox, 0, 1, Qt.AlignLeft | Qt.AlignTop)
-        options_grid.addWidget(self.save_video_checkbox, 0, 2, Qt.AlignLeft | Qt.AlignTop)
-        options_grid.addWidget(self.metadata_enhance_checkbox, 1, 0, Qt.AlignLeft | Qt.AlignTop)
-        options_grid.addWidget(self.disable_ai_transcribe_checkbox, 1, 1, Qt.AlignLeft | Qt.AlignTop)
-        options_grid.addWidget(self.phase2_skip_existing_checkbox, 1, 2, Qt.AlignLeft | Qt.AlignTop)
+        # Arranged in a 2x3 grid (see _OPTION_CHECKBOXES), top-left aligned so
+        # the columns line up vertically
+        for attr, label, key, object_name, role, row, col, tip in _OPTION_CHECKBOXES:
+            cb = QCheckBox(label)
+            if object_name:
+                cb.setObjectName(object_name)
+            if role:
+                cb.setProperty("role", role)
+            cb.setChecked(opts[key])
+            _tip(cb, tip)
+            options_grid.addWidget(cb, row, col, _ALIGN_TL)
+            setattr(self, attr, cb)
 
         options_container.addLayout(options_grid)
         lang_range_options_layout.addLayout(options_container, 1)  # Options section takes remaining space and aligns right
@@ -447,17 +672,17 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
         # Arrange checkboxes in a grid layout - 3 columns
         row, col = 0, 0
         columns = 3
-        style_defaults = self.ui_config["default_checked_styles"]
+        # default_checked_styles is either {name: bool} or a list of names
+        style_defaults = ui["default_checked_styles"]
+        if isinstance(style_defaults, dict):
+            checked = frozenset(k for k, v in style_defaults.items() if v)
+        else:
+            checked = frozenset(style_defaults or ())
+        add_style_widget = style_layout.addWidget
         for style_name in style_keys:
             cb = QCheckBox(style_name)
-            checked = (
-                style_defaults.get(style_name, False)
-                if isinstance(style_defaults, dict)
-                else style_name in (style_defaults or [])
-            )
-            if checked:
-                cb.setChecked(True)
-            style_layout.addWidget(cb, row, col)
+            cb.setChecked(style_name in checked)
+            add_style_widget(cb, row, col)
             self.style_checkboxes[style_name] = cb
             col += 1
             if col >= columns:
@@ -477,10 +702,11 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
 
         # Header with value
         chunk_header_layout = QHBoxLayout()
-        chunk_size_label = QLabel("LLM Chunk Size (Advanced):")  # Label updated
-        chunk_size_label.setObjectName("ChunkSizeLabel")
-        chunk_size_label.setToolTip("Max words per chunk sent to the Phase 2 LLM. Lower = more API calls but safer for context limits.")
-        chunk_cfg = self.ui_config["chunk_size"]
+        chunk_size_label = self._mk_section_label(
+            "LLM Chunk Size (Advanced):",
+            object_name="ChunkSizeLabel",
+            tooltip="Max words per chunk sent to the Phase 2 LLM. Lower = more API calls but safer for context limits.",
+        )
         default_chunk = chunk_cfg["default"]
         self.chunk_size_value_label = QLabel(str(default_chunk))
         self.chunk_size_value_label.setObjectName("ChunkSizeValueLabel")
@@ -491,7 +717,7 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
         chunk_size_layout.addLayout(chunk_header_layout)
 
         # Slider
-        self.chunk_size_slider = QSlider(Qt.Horizontal)
+        self.chunk_size_slider = QSlider(_HORIZ)
         self.chunk_size_slider.setObjectName("ChunkSlider")
         self.chunk_size_slider.setToolTip(
             f"Drag to set max words per refinement chunk. Default {default_chunk}."
@@ -499,7 +725,6 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
         self.chunk_size_slider.setMinimum(chunk_cfg["min"])
         self.chunk_size_slider.setMaximum(chunk_cfg["max"])
         self.chunk_size_slider.setValue(default_chunk)
-        self.chunk_size_slider.valueChanged.connect(self.update_chunk_size_label)
         chunk_size_layout.addWidget(self.chunk_size_slider)
 
         # Description
@@ -545,9 +770,11 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
         # --- Directory Input (remains below) ---
         main_output_layout = QVBoxLayout()
         main_output_layout.setSpacing(6)
-        main_output_label = QLabel("Main Output Folder:")
-        main_output_label.setObjectName("SummaryOutputDirLabel")
-        main_output_label.setToolTip("Where refined Markdown files are saved. One file per (source, style) combination.")
+        main_output_label = self._mk_section_label(
+            "Main Output Folder:",
+            object_name="SummaryOutputDirLabel",
+            tooltip="Where refined Markdown files are saved. One file per (source, style) combination.",
+        )
         main_output_layout.addWidget(main_output_label)
         main_output_layout.addSpacing(3)
         main_output_row = QHBoxLayout()
@@ -557,119 +784,63 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
         self.summary_output_dir_input.setPlaceholderText("Select main output folder")
         main_output_btn = QPushButton("Choose Folder")
         main_output_btn.setObjectName("DirectoryButton")
+        main_output_btn.setProperty("role", "picker")
         main_output_btn.setToolTip("Choose where refined Markdown files will be saved.")
         main_output_btn.clicked.connect(self.select_summary_output_directory)
         main_output_btn.setFixedWidth(140)
+        self._toggleable_buttons.append(main_output_btn)
         main_output_row.addWidget(self.summary_output_dir_input)
         main_output_row.addWidget(main_output_btn)
         main_output_layout.addLayout(main_output_row)
         input_layout.addLayout(main_output_layout)
 
-        # API Key Inputs
+        # API Key Inputs (see _API_KEY_INPUTS)
         api_keys_layout = QHBoxLayout()  # Use QHBoxLayout for side-by-side
         api_keys_layout.setSpacing(10)
 
-        # Gemini API Key Input
-        gemini_api_key_layout = QVBoxLayout()
-        gemini_api_key_layout.setSpacing(6)
-        gemini_api_key_label = QLabel("Gemini API Key:")
-        gemini_api_key_label.setObjectName("ApiKeyLabel")  # Generic, or make specific
-        gemini_api_key_label.setToolTip("Google Gemini API key for Phase 2 refinement. Get one at Google AI Studio.")
-        self.gemini_api_key_input = QLineEdit()
-        self.gemini_api_key_input.setPlaceholderText("Enter your Gemini API key")
-        self.gemini_api_key_input.setToolTip("Paste your Gemini API key. Can also be set via GEMINI_API_KEY env var.")
-        self.gemini_api_key_input.setEchoMode(QLineEdit.Password)
-        self.gemini_api_key_input.setText(os.environ.get("GEMINI_API_KEY", ""))
-        gemini_api_key_layout.addWidget(gemini_api_key_label)
-        gemini_api_key_layout.addSpacing(3)
-        gemini_api_key_layout.addWidget(self.gemini_api_key_input)
-        api_keys_layout.addLayout(gemini_api_key_layout)
-
-        # ZAI API Key Input
-        zai_api_key_layout = QVBoxLayout()
-        zai_api_key_layout.setSpacing(6)
-        zai_api_key_label = QLabel("ZAI API Key:")
-        zai_api_key_label.setObjectName("ApiKeyLabel")
-        zai_api_key_label.setToolTip("ZAI (Zhipu) API key for Phase 2 refinement. Optional if using Gemini.")
-        self.zai_api_key_input = QLineEdit()
-        self.zai_api_key_input.setPlaceholderText("Enter your ZAI API key")
-        self.zai_api_key_input.setToolTip("Paste your ZAI API key. Can also be set via ZAI_API_KEY env var.")
-        self.zai_api_key_input.setEchoMode(QLineEdit.Password)
-        self.zai_api_key_input.setText(os.environ.get("ZAI_API_KEY", ""))
-        zai_api_key_layout.addWidget(zai_api_key_label)
-        zai_api_key_layout.addSpacing(3)
-        zai_api_key_layout.addWidget(self.zai_api_key_input)
-        api_keys_layout.addLayout(zai_api_key_layout)
-
-        # OpenAI API Key Input
-        openai_api_key_layout = QVBoxLayout()
-        openai_api_key_layout.setSpacing(6)
-        openai_api_key_label = QLabel("OpenAI API Key (for STT):")
-        openai_api_key_label.setObjectName("OpenAiApiKeyLabel")
-        openai_api_key_label.setToolTip("OpenAI API key for speech-to-text (ASR) when captions are unavailable. Optional.")
-        self.openai_api_key_input = QLineEdit()
-        self.openai_api_key_input.setPlaceholderText(
-            "Enter your OpenAI API key for STT"
-        )
-        self.openai_api_key_input.setToolTip("Paste your OpenAI API key. Can also be set via OPENAI_API_KEY env var.")
-        self.openai_api_key_input.setEchoMode(QLineEdit.Password)
-        self.openai_api_key_input.setText(os.environ.get("OPENAI_API_KEY", ""))
-        openai_api_key_layout.addWidget(openai_api_key_label)
-        openai_api_key_layout.addSpacing(3)
-        openai_api_key_layout.addWidget(self.openai_api_key_input)
-        api_keys_layout.addLayout(openai_api_key_layout)
-
-        # DeepSeek API Key Input
-        deepseek_api_key_layout = QVBoxLayout()
-        deepseek_api_key_layout.setSpacing(6)
-        deepseek_api_key_label = QLabel("DeepSeek API Key:")
-        deepseek_api_key_label.setObjectName("ApiKeyLabel")
-        deepseek_api_key_label.setToolTip("DeepSeek API key for Phase 2 refinement. Optional if using Gemini or ZAI.")
-        self.deepseek_api_key_input = QLineEdit()
-        self.deepseek_api_key_input.setPlaceholderText("Enter your DeepSeek API key")
-        self.deepseek_api_key_input.setToolTip("Paste your DeepSeek API key. Can also be set via DEEPSEEK_API_KEY env var.")
-        self.deepseek_api_key_input.setEchoMode(QLineEdit.Password)
-        self.deepseek_api_key_input.setText(os.environ.get("DEEPSEEK_API_KEY", ""))
-        deepseek_api_key_layout.addWidget(deepseek_api_key_label)
-        deepseek_api_key_layout.addSpacing(3)
-        deepseek_api_key_layout.addWidget(self.deepseek_api_key_input)
-        api_keys_layout.addLayout(deepseek_api_key_layout)
+        for attr, label, env, placeholder, object_name, label_tip in _API_KEY_INPUTS:
+            key_layout, key_input = self._labeled_lineedit(
+                label,
+                placeholder,
+                f"Paste your {label.split(' API Key')[0]} API key. Can also be set via {env} env var.",
+                label_object_name=object_name,
+                label_tip=label_tip,
+                text=_ENV_KEYS.get(env, ""),
+                password=True,
+            )
+            api_keys_layout.addLayout(key_layout)
+            setattr(self, attr, key_input)
 
         input_layout.addLayout(api_keys_layout)
 
         # ASR and Phase 2 model selection (one row, two combos)
         model_select_layout = QHBoxLayout()
         model_select_layout.setSpacing(10)
-        asr_layout = QVBoxLayout()
-        asr_layout.setSpacing(6)
-        asr_label = QLabel("ASR Model:")
-        asr_label.setToolTip("Speech-to-text model used when captions are missing (e.g. YouTube no-caption, local audio).")
-        self.asr_model_combo = QComboBox()
-        self.asr_model_combo.setToolTip("Choose ASR provider/model. Requires corresponding API key if not built-in.")
-        self._asr_models = get_asr_models()
-        for m in self._asr_models:
-            self.asr_model_combo.addItem(m.get("label", m.get("id", "")), m.get("id"))
-        default_asr = get_default_asr_id()
-        idx = next((i for i, m in enumerate(self._asr_models) if m.get("id") == default_asr), 0)
-        self.asr_model_combo.setCurrentIndex(idx)
-        asr_layout.addWidget(asr_label)
-        asr_layout.addWidget(self.asr_model_combo)
-        model_select_layout.addLayout(asr_layout)
-        phase2_layout = QVBoxLayout()
-        phase2_layout.setSpacing(6)
-        phase2_label = QLabel("Phase 2 Model:")
-        phase2_label.setToolTip("LLM used to refine transcripts into formatted documents. Requires Gemini, ZAI, or DeepSeek API key.")
-        self.phase2_model_combo = QComboBox()
-        self.phase2_model_combo.setToolTip("Select provider and model for refinement. Must match an API key you entered.")
-        self._phase2_models = get_phase2_models()
-        for m in self._phase2_models:
-            self.phase2_model_combo.addItem(m.get("label", m.get("id", "")), m.get("id"))
-        default_phase2 = get_default_phase2_id()
-        idx2 = next((i for i, m in enumerate(self._phase2_models) if m.get("id") == default_phase2), 0)
-        self.phase2_model_combo.setCurrentIndex(idx2)
-        phase2_layout.addWidget(phase2_label)
-        phase2_layout.addWidget(self.phase2_model_combo)
-        model_select_layout.addLayout(phase2_layout)
+        # Model combos start with just the default entry; the full list is added on first open
+        for attr, kind, label, label_tip, combo_tip, default_id, populate in (
+            (
+                "asr_model_combo", "asr", "ASR Model:",
+                "Speech-to-text model used when captions are missing (e.g. YouTube no-caption, local audio).",
+                "Choose ASR provider/model. Requires corresponding API key if not built-in.",
+                get_default_asr_id(), self._populate_asr_models,
+            ),
+            (
+                "phase2_model_combo", "phase2", "Phase 2 Model:",
+                "LLM used to refine transcripts into formatted documents. Requires Gemini, ZAI, or DeepSeek API key.",
+                "Select provider and model for refinement. Must match an API key you entered.",
+                get_default_phase2_id(), self._populate_phase2_models,
+            ),
+        ):
+            combo_layout = QVBoxLayout()
+            combo_layout.setSpacing(6)
+            combo = LazyComboBox(populate)
+            combo.setToolTip(combo_tip)
+            m = get_model_by_id(default_id, kind) or {}
+            combo.addItem(m.get("label", default_id), default_id)
+            combo_layout.addWidget(self._mk_section_label(label, role=None, tooltip=label_tip))
+            combo_layout.addWidget(combo)
+            model_select_layout.addLayout(combo_layout)
+            setattr(self, attr, combo)
         input_layout.addLayout(model_select_layout)
 
         main_layout.addWidget(input_container)
@@ -693,6 +864,9 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
         self.status_display = QTextEdit()
         self.status_display.setObjectName("StatusDisplay")
         self.status_display.setReadOnly(True)
+        self.status_display.setUndoRedoEnabled(False)  # read-only log: no undo stack
+        # Keep the newest lines only; older blocks are dropped as new ones arrive
+        self.status_display.document().setMaximumBlockCount(_STATUS_MAX_BLOCKS)
         self.status_display.setToolTip("Live log: current item, phase, and any errors.")
         progress_layout.addWidget(self.status_display)
         main_layout.addWidget(progress_container)
@@ -706,14 +880,10 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
             "ExtractButton"
         )  # Keep object name for styling if desired
         self.start_button.setToolTip("Start transcript extraction and refinement with current settings.")
-        self.start_button.clicked.connect(
-            self.start_processing_flow
-        )  # Updated method call
 
         self.cancel_button = QPushButton("Cancel")
         self.cancel_button.setObjectName("CancelButton")
         self.cancel_button.setToolTip("Stop the current run after the current item finishes.")
-        self.cancel_button.clicked.connect(self.cancel_processing)
         self.cancel_button.setEnabled(False)
 
         control_layout.addStretch(1)
@@ -723,10 +893,136 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
         main_layout.addLayout(control_layout)
 
         self.central_widget.setLayout(main_layout)
+        self.central_widget.setUpdatesEnabled(True)
         self.setMinimumHeight(900)
         self.resize(1000, 1000)
         self.center()
-        self.setAttribute(Qt.WA_AlwaysShowToolTips)
+        self.setAttribute(_WA_ALWAYS)
+
+    def _populate_asr_models(self):
+        from utils.models_config import get_asr_models
+
+        self._asr_models = get_asr_models()
+        self._asr_by_id = {m.get("id"): m for m in self._asr_models}
+        self._asr_id_to_index = {m.get("id"): i for i, m in enumerate(self._asr_models)}
+        self._fill_model_combo(self.asr_model_combo, self._asr_models, self._asr_id_to_index)
+
+    def _populate_phase2_models(self):
+        from utils.models_config import get_phase2_models
+
+        self._phase2_models = get_phase2_models()
+        self._phase2_by_id = {m.get("id"): m for m in self._phase2_models}
+        self._phase2_id_to_index = {m.get("id"): i for i, m in enumerate(self._phase2_models)}
+        self._fill_model_combo(self.phase2_model_combo, self._phase2_models, self._phase2_id_to_index)
+
+    @staticmethod
+    def _fill_model_combo(combo, models, id_to_index):
+        """Replace the combo's seed item with all models, keeping the current selection."""
+        current = combo.currentData()
+        # One bulk insert; the selection ends where it started, so no change signals are needed
+        with QSignalBlocker(combo):
+            combo.clear()
+            combo.addItems([m.get("label", m.get("id", "")) for m in models])
+            for i, m in enumerate(models):
+                combo.setItemData(i, m.get("id"))
+            combo.setCurrentIndex(id_to_index.get(current, 0))
+
+    def _ensure_models_loaded(self):
+        """Fill both model combos (and the _asr_*/_phase2_* lookups) if their popups were never opened."""
+        self.asr_model_combo.ensure_loaded()
+        self.phase2_model_combo.ensure_loaded()
+
+    def _wire_signals(self):
+        """
+        Connect widget signals once initUI has built the whole tree, so no
+        handler runs against half-built UI while defaults are being applied.
+        """
+        self.url_input.textChanged.connect(self._on_url_input_changed)
+        self.btn_media_folder.clicked.connect(self._on_select_media_folder)
+        self.btn_doc_folder.clicked.connect(self._on_select_document_folder)
+        self.phase_1_only_checkbox.toggled.connect(self.on_phase_1_only_toggled)
+        self.phase_2_only_checkbox.toggled.connect(self.on_phase_2_only_toggled)
+        self.batch_checkbox.toggled.connect(self._on_batch_checkbox_changed)
+        self.chunk_size_slider.valueChanged.connect(self.update_chunk_size_label)
+        self.start_button.clicked.connect(self.start_processing_flow)
+        self.cancel_button.clicked.connect(self.cancel_processing)
+
+        # Defaults were set before connecting; apply the one that affects other widgets
+        if self.batch_checkbox.isChecked():
+            self._on_batch_checkbox_changed(True)
+
+    def _mk_section_label(self, text, *, object_name=None, role="heading", align=None, tooltip=None):
+        """Creates a QLabel with its QSS hooks (object name, role property), alignment and tooltip."""
+        label = QLabel(text)
+        if object_name:
+            label.setObjectName(object_name)
+        if role:
+            label.setProperty("role", role)
+        if align is not None:
+            label.setAlignment(align)
+        if tooltip:
+            label.setToolTip(tooltip)
+        return label
+
+    def _labeled_lineedit(
+        self,
+        label_text,
+        placeholder,
+        tooltip,
+        *,
+        label_object_name=None,
+        label_tip=None,
+        text="",
+        password=False,
+        fixed_width=None,
+        fixed_height=None,
+    ):
+        """
+        Creates a heading label stacked above a QLineEdit.
+
+        Returns:
+            tuple: (QVBoxLayout, QLineEdit) - the caller adds the layout and keeps the line edit.
+        """
+        layout = QVBoxLayout()
+        layout.setSpacing(6)
+        label = self._mk_section_label(
+            label_text, object_name=label_object_name, align=_ALIGN_TOP, tooltip=label_tip
+        )
+        line_edit = QLineEdit(text)
+        line_edit.setPlaceholderText(placeholder)
+        line_edit.setToolTip(tooltip)
+        if password:
+            line_edit.setEchoMode(_PWD)
+        if fixed_width:
+            line_edit.setFixedWidth(fixed_width)
+        if fixed_height:
+            line_edit.setFixedHeight(fixed_height)
+        layout.addWidget(label)
+        layout.addSpacing(3)
+        layout.addWidget(line_edit)
+        return layout, line_edit
+
+    def _build_csv_row(self):
+        """Create the CSV file row (label, path display, select button) below the input path."""
+        csv_row_layout = QHBoxLayout()
+        csv_file_label = self._mk_section_label(
+            "CSV file:",
+            role=None,
+            tooltip="Batch input: one row per job. Required columns: url or path. Optional: style_ids, language, output_subdir.",
+        )
+        self.csv_path_display = QLineEdit()
+        self.csv_path_display.setReadOnly(True)
+        self.csv_path_display.setPlaceholderText("No CSV selected")
+        self.csv_path_display.setToolTip("Path to the selected CSV file. Columns: url/path, optional style_ids, language, output_subdir.")
+        self.btn_select_csv = QPushButton("Select CSV File")
+        _tip(self.btn_select_csv, "Choose a CSV file that lists multiple inputs and optional per-row overrides (styles, language, output subdir).")
+        self.btn_select_csv.clicked.connect(self._on_select_csv_file)
+        csv_row_layout.addWidget(csv_file_label)
+        csv_row_layout.addWidget(self.csv_path_display)
+        csv_row_layout.addWidget(self.btn_select_csv)
+        self.csv_row_container = QWidget()
+        self.csv_row_container.setLayout(csv_row_layout)
+        self._url_layout.addWidget(self.csv_row_container)
 
     def create_file_input_widget(
         self, label_text, button_text, field_name, handler, label_object_name=""
@@ -749,9 +1045,9 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
         layout.setContentsMargins(0, 0, 0, 0)  # Remove extra margins
         layout.setSpacing(6)
 
-        label = QLabel(label_text)
-        if label_object_name:
-            label.setObjectName(label_object_name)
+        label = self._mk_section_label(
+            label_text, object_name=label_object_name or None, role="heading" if label_object_name else None
+        )
         layout.addWidget(label)
         layout.addSpacing(3)
 
@@ -765,8 +1061,10 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
 
         button = QPushButton(button_text)
         button.setObjectName("FileButton")
+        button.setProperty("role", "picker")
         button.clicked.connect(handler)
         button.setFixedWidth(120)
+        self._toggleable_buttons.append(button)
 
         input_row.addWidget(input_field)
         input_row.addWidget(button)
@@ -824,9 +1122,9 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
         layout = QVBoxLayout()
         layout.setSpacing(6)
 
-        label = QLabel(label_text)
-        if label_object_name:
-            label.setObjectName(label_object_name)
+        label = self._mk_section_label(
+            label_text, object_name=label_object_name or None, role="heading" if label_object_name else None
+        )
         layout.addWidget(label)
         layout.addSpacing(3)
 
@@ -848,8 +1146,10 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
 
         button = QPushButton(button_text)
         button.setObjectName("DirectoryButton")
+        button.setProperty("role", "picker")
         button.clicked.connect(handler)
         button.setFixedWidth(140)
+        self._toggleable_buttons.append(button)
 
         input_row.addWidget(input_field)
         input_row.addWidget(button)
@@ -864,11 +1164,29 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
         frame.moveCenter(center_point)
         self.move(frame.topLeft())
 
-    def validate_inputs(self):
+    def _snapshot_texts(self):
+        """Stripped text of every field in _TEXT_FIELDS, read once."""
+        return {name: getattr(self, name).text().strip() for name in _TEXT_FIELDS}
+
+    def validate_inputs(self, csv_validated=False, texts=None, styles=None):
         """
         Validates all user inputs before starting the processing.
         This will be adapted for PocketFlow.
+
+        Args:
+            csv_validated (bool): The batch CSV was already parsed by a CsvValidationTask.
+            texts (dict): Field texts from _snapshot_texts(); read here if not given.
+            styles (list): Result of get_selected_styles(); read here if not given.
         """
+        if texts is None:
+            texts = self._snapshot_texts()
+        if styles is None:
+            styles = self.get_selected_styles()
+        # Apply a still-pending URL edit so input_mode_hint is current
+        if self._url_debounce.isActive():
+            self._url_debounce.stop()
+            self._on_url_input_changed_debounced()
+
         is_csv_mode = self.batch_checkbox.isChecked()
         if is_csv_mode:
             if not self.csv_path or not os.path.isfile(self.csv_path):
@@ -877,28 +1195,25 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
                     "Please select a valid CSV file.",
                 )
                 return False
-            try:
-                from utils.csv_batch import parse_bodhiflow_csv
-                parse_bodhiflow_csv(self.csv_path)
-            except (ValueError, FileNotFoundError) as e:
-                self._show_warning_message(
-                    "CSV validation failed",
-                    f"CSV format or content is invalid. Please fix and retry.\n\n{e}",
-                )
-                return False
+            if not csv_validated:
+                try:
+                    from utils.csv_batch import parse_bodhiflow_csv
+                    parse_bodhiflow_csv(self.csv_path)
+                except (ValueError, FileNotFoundError) as e:
+                    self._show_csv_validation_error(e)
+                    return False
             # Skip URL/path validation; CSV will be parsed in main
 
-        # Handle Phase 2 Only mode - "No Input Allowed" is valid (single-input mode only)
-        if not is_csv_mode and self.url_input.text().strip() == "No Input Allowed":
+        # Handle Phase 2 Only mode - the disabled URL input is valid (single-input mode only)
+        if not is_csv_mode and self._url_disabled:
             # This is valid for Phase 2 Only mode, skip URL validation
             pass
         elif not is_csv_mode:
-            url_text = self.url_input.text().strip()
+            url_text = texts["url_input"]
             # Import input handler to check input type (pass hint for folder: media vs document)
             from utils.input_handler import get_input_type
 
-            input_mode_hint = getattr(self, "input_mode_hint", None)
-            input_type = get_input_type(url_text, input_mode_hint)
+            input_type = get_input_type(url_text, self.input_mode_hint)
 
             if input_type == "unknown_url":
                 self._show_warning_message(
@@ -907,21 +1222,7 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
                 )
                 return False
 
-            valid_input_types = [
-                "youtube_video_url",
-                "youtube_playlist_url",
-                "teams_meeting_url",
-                "podcast_rss_url",
-                "file",
-                "folder",
-                "text_file",
-                "pdf_file",
-                "word_file",
-                "webpage_url",
-                "document_folder",
-            ]
-
-            if input_type not in valid_input_types:
+            if input_type not in _VALID_INPUT_TYPES:
                 self._show_warning_message(
                     "Invalid Input Source",
                     "Please enter a valid YouTube URL (playlist/video), Teams videomanifest URL, Podcast RSS URL, webpage URL, or an existing local file/folder path.",
@@ -929,11 +1230,9 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
                 return False
 
             # Additional validation for local paths
-            is_local_path = input_type in ["file", "folder", "text_file", "pdf_file", "word_file", "document_folder"]
+            is_local_path = input_type in _LOCAL_INPUT_TYPES
 
-            if is_local_path and not (
-                os.path.isfile(url_text) or os.path.isdir(url_text)
-            ):
+            if is_local_path and _stat_kind(url_text) is None:
                 self._show_warning_message(
                     "Invalid Local Path",
                     "The provided local path is not a valid file or folder.",
@@ -941,7 +1240,7 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
                 return False
 
         # Validate Intermediate directory only if provided
-        intermediate_dir_path = self.intermediate_dir_input.text().strip()
+        intermediate_dir_path = texts["intermediate_dir_input"]
         if intermediate_dir_path and not os.path.isdir(intermediate_dir_path):
             self._show_warning_message(
                 "Invalid Directory",
@@ -950,9 +1249,7 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
             return False
 
         # Validate Output directory
-        output_dir = (
-            self.summary_output_dir_input.text().strip()
-        )  # Renamed summary_output_dir_input
+        output_dir = texts["summary_output_dir_input"]
         if not output_dir:
             self._show_warning_message(
                 "Output Folder Required", "Please select an Output Folder."
@@ -966,69 +1263,51 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
         run_phase_1 = not phase_2_only
         run_phase_2 = not phase_1_only
 
+        from utils.models_config import get_default_asr_id, get_default_phase2_id
+
+        self._ensure_models_loaded()
         asr_id = self.asr_model_combo.currentData() or get_default_asr_id()
         phase2_id = self.phase2_model_combo.currentData() or get_default_phase2_id()
-        asr_entry = next((m for m in self._asr_models if m.get("id") == asr_id), None)
-        phase2_entry = next((m for m in self._phase2_models if m.get("id") == phase2_id), None)
+        asr_entry = self._asr_by_id.get(asr_id)
+        phase2_entry = self._phase2_by_id.get(phase2_id)
         asr_provider = asr_entry.get("provider", "openai") if asr_entry else "openai"
         phase2_provider = phase2_entry.get("provider", "zai") if phase2_entry else "zai"
 
-        # Only require ASR key when Phase 1 will run
+        # Only require the ASR key when Phase 1 will run, and the Phase 2 model key when Phase 2 will
+        required = []
         if run_phase_1:
-            if asr_provider == "openai" and not self.openai_api_key_input.text().strip():
-                self._show_warning_message(
-                    "API Key Required", "OpenAI API key is required for the selected ASR model."
-                )
-                return False
-            if asr_provider == "zai" and not self.zai_api_key_input.text().strip():
-                self._show_warning_message(
-                    "API Key Required", "ZAI API key is required for the selected ASR model."
-                )
-                return False
-
-        # Only require Phase 2 model key when Phase 2 will run
+            required.append((asr_provider, "ASR"))
         if run_phase_2:
-            if phase2_provider == "gemini" and not self.gemini_api_key_input.text().strip():
+            required.append((phase2_provider, "Phase 2"))
+        for provider, role in required:
+            key_field = _PROVIDER_KEY_FIELDS.get(provider)
+            if key_field is not None and not texts[key_field]:
                 self._show_warning_message(
-                    "API Key Required", "Gemini API key is required for the selected Phase 2 model."
-                )
-                return False
-            if phase2_provider == "openai" and not self.openai_api_key_input.text().strip():
-                self._show_warning_message(
-                    "API Key Required", "OpenAI API key is required for the selected Phase 2 model."
-                )
-                return False
-            if phase2_provider == "deepseek" and not self.deepseek_api_key_input.text().strip():
-                self._show_warning_message(
-                    "API Key Required", "DeepSeek API key is required for the selected Phase 2 model."
-                )
-                return False
-            if phase2_provider == "zai" and not self.zai_api_key_input.text().strip():
-                self._show_warning_message(
-                    "API Key Required", "ZAI API key is required for the selected Phase 2 model."
+                    "API Key Required",
+                    f"{_PROVIDER_NAMES[provider]} API key is required for the selected {role} model.",
                 )
                 return False
 
-        if not self.language_input.text().strip():
+        if not texts["language_input"]:
             self._show_warning_message(
                 "Language Required", "Please specify the output language"
             )
             return False
 
         # Only require at least one refinement style when Phase 2 will run
-        if run_phase_2 and not any(cb.isChecked() for cb in self.style_checkboxes.values()):
+        if run_phase_2 and not styles:
             self._show_warning_message(
                 "No Style Selected", "Please select at least one Refinement Style."
             )
             return False
 
         try:
-            start_index_str = self.start_index_input.text().strip()
+            start_index_str = texts["start_index_input"]
             self.start_index = int(start_index_str) if start_index_str else 1
             if self.start_index < 1:
                 raise ValueError("Start index must be 1 or greater.")
 
-            end_index_str = self.end_index_input.text().strip()
+            end_index_str = texts["end_index_input"]
             self.end_index = int(end_index_str) if end_index_str else 0
             if self.end_index != 0 and self.end_index < self.start_index:
                 raise ValueError("End index must be 0 (for all) or >= start index.")
@@ -1053,54 +1332,61 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
         Updates the UI state based on whether processing is active.
         """
         self.is_processing = processing
-        self.start_button.setEnabled(not processing)  # Updated button name
-        self.cancel_button.setEnabled(processing)
-
-        inputs = [
-            self.url_input,
-            self.intermediate_dir_input,
-            self.cookie_file_input,
-            self.summary_output_dir_input,
-            self.gemini_api_key_input,
-            self.zai_api_key_input,
-            self.openai_api_key_input,
-            self.deepseek_api_key_input,
-            self.asr_model_combo,
-            self.phase2_model_combo,
-            self.language_input,
-            self.start_index_input,
-            self.end_index_input,
-            self.chunk_size_slider,
-            self.resume_checkbox,
-            self.disable_ai_transcribe_checkbox,
-            self.save_video_checkbox,
-            self.metadata_enhance_checkbox,
-            self.phase_1_only_checkbox,  # Added phase control checkboxes
-            self.phase_2_only_checkbox,
-            self.batch_checkbox,  # Added batch checkbox
-            self.document_folder_recursive_checkbox,
-            self.phase2_skip_existing_checkbox,
-        ]
-        for style_cb in self.style_checkboxes.values():
-            style_cb.setEnabled(not processing)
-
-        for input_field in inputs:
-            if isinstance(input_field, (QLineEdit, QTextEdit)):
-                input_field.setReadOnly(processing)
-            elif isinstance(input_field, QCheckBox):
-                input_field.setEnabled(not processing)
-            else:
-                input_field.setEnabled(not processing)
-
-        # Disable folder selection buttons and CSV button during processing
-        self.btn_media_folder.setEnabled(not processing)
-        self.btn_doc_folder.setEnabled(not processing)
-        self.btn_select_csv.setEnabled(not processing)
-
-        # Disable file/directory selection buttons (Choose File, Choose Folder)
-        for button in self.findChildren(QPushButton):
-            if button.objectName() in ["FileButton", "DirectoryButton"]:
+        # One repaint for the whole batch of enable/read-only changes
+        self.setUpdatesEnabled(False)
+        try:
+            self.start_button.setEnabled(not processing)  # Updated button name
+            self.cancel_button.setEnabled(processing)
+
+            inputs = [
+                self.url_input,
+                self.intermediate_dir_input,
+                self.cookie_file_input,
+                self.summary_output_dir_input,
+                self.gemini_api_key_input,
+                self.zai_api_key_input,
+                self.openai_api_key_input,
+                self.deepseek_api_key_input,
+                self.asr_model_combo,
+                self.phase2_model_combo,
+                self.language_input,
+                self.start_index_input,
+                self.end_index_input,
+                self.chunk_size_slider,
+                self.resume_checkbox,
+                self.disable_ai_transcribe_checkbox,
+                self.save_video_checkbox,
+                self.metadata_enhance_checkbox,
+                self.phase_1_only_checkbox,  # Added phase control checkboxes
+                self.phase_2_only_checkbox,
+                self.batch_checkbox,  # Added batch checkbox
+                self.document_folder_recursive_checkbox,
+                self.phase2_skip_existing_checkbox,
+            ]
+            for style_cb in self.style_checkboxes.values():
+                style_cb.setEnabled(not processing)
+
+            for input_field in inputs:
+                with QSignalBlocker(input_field):
+                    if isinstance(input_field, (QLineEdit, QTextEdit)):
+                        input_field.setReadOnly(processing)
+                    elif isinstance(input_field, QCheckBox):
+                        input_field.setEnabled(not processing)
+                    else:
+                        input_field.setEnabled(not processing)
+
+            # Disable folder selection buttons and CSV button during processing
+            self.btn_media_folder.setEnabled(not processing)
+            self.btn_doc_folder.setEnabled(not processing)
+            if self.btn_select_csv is not None:
+                self.btn_select_csv.setEnabled(not processing)
+
+            # Disable file/directory selection buttons (Choose File, Choose Folder)
+            for button in self._toggleable_buttons:
                 button.setEnabled(not processing)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
     def select_gemini_model(self):
         """Optional model selector; you can remove or adapt this as needed."""
@@ -1137,26 +1423,64 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
         """
         Retrieves all selected refinement styles and their prompt templates.
         """
-        selected = []
-        for style_name, cb in self.style_checkboxes.items():
-            if cb.isChecked():
-                selected.append((style_name, self.prompts[style_name]))
-        return selected
+        prompts = self.prompts
+        return [(style_name, prompts[style_name]) for style_name, cb in self.style_checkboxes.items() if cb.isChecked()]
 
+    def _show_csv_validation_error(self, error):
+        self._show_warning_message(
+            "CSV validation failed",
+            f"CSV format or content is invalid. Please fix and retry.\n\n{error}",
+        )
+
+    @pyqtSlot()
     def start_processing_flow(self):  # Renamed from start_extraction_and_refinement
         """
         Starts the main PocketFlow processing.
         This will be the primary integration point with PocketFlow.
+        In batch mode the CSV is parsed on a pool thread first; _on_csv_validated continues.
         """
-        if not self.validate_inputs():
+        if self.batch_checkbox.isChecked() and self.csv_path and os.path.isfile(self.csv_path):
+            self.start_button.setEnabled(False)
+            task = CsvValidationTask(self.csv_path)
+            task.signals.validated.connect(self._on_csv_validated)
+            self._csv_validation_signals = task.signals  # keep alive until the result arrives
+            QThreadPool.globalInstance().start(task)
+            return
+        self._start_processing_flow()
+
+    @pyqtSlot(str, bool, str)
+    def _on_csv_validated(self, csv_path, ok, error):
+        self._csv_validation_signals = None
+        self.start_button.setEnabled(True)
+        if not self.batch_checkbox.isChecked() or csv_path != self.csv_path:
+            # The CSV or batch mode changed while validating; check what is selected now
+            self.start_processing_flow()
             return
+        if not ok:
+            self._show_csv_validation_error(error)
+            return
+        self._start_processing_flow(csv_validated=True)
+
+    def _start_processing_flow(self, csv_validated=False):
+        texts = self._snapshot_texts()
+        selected_styles = self.get_selected_styles()
+        if not self.validate_inputs(csv_validated, texts, selected_styles):
+            return
+
+        from utils.models_config import (
+            get_default_asr_id,
+            get_default_phase2_id,
+            get_phase2_model_max_concurrency,
+        )
 
+        self._ensure_models_loaded()
         asr_model_id = self.asr_model_combo.currentData() or get_default_asr_id()
         phase2_model_id = self.phase2_model_combo.currentData() or get_default_phase2_id()
         self.selected_model_name = phase2_model_id  # kept for any legacy reference
 
         self.set_processing_state(True)
-        self.progress_bar.setValue(0)
+        self.update_gui_progress(0)
+        self._status_buffer.clear()
         self.status_display.clear()
 
         # --- Collect all parameters for PocketFlow ---
@@ -1173,8 +1497,8 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
             run_phase_2 = not phase_1_only
 
         # Get intermediate_dir from GUI or use default relative to output_base_dir
-        output_base_dir = self.summary_output_dir_input.text().strip()
-        intermediate_dir_input = self.intermediate_dir_input.text().strip()
+        output_base_dir = texts["summary_output_dir_input"]
+        intermediate_dir_input = texts["intermediate_dir_input"]
         if intermediate_dir_input:
             intermediate_dir = intermediate_dir_input
         else:
@@ -1182,15 +1506,15 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
             intermediate_dir = os.path.join(output_base_dir, "intermediate_transcripts")
 
         flow_params = {
-            "user_input_path": "" if is_csv_mode else self.url_input.text().strip(),
-            "input_mode_hint": None if is_csv_mode else getattr(self, "input_mode_hint", None),
-            "cookie_file_path": self.cookie_file_input.text().strip() or None,
-            "selected_styles_data": self.get_selected_styles(),  # List of (name, prompt_text)
-            "output_language": self.language_input.text().strip(),
-            "gemini_api_key": self.gemini_api_key_input.text().strip(),
-            "openai_api_key": self.openai_api_key_input.text().strip(),
-            "zai_api_key": self.zai_api_key_input.text().strip(),
-            "deepseek_api_key": self.deepseek_api_key_input.text().strip(),
+            "user_input_path": "" if is_csv_mode else texts["url_input"],
+            "input_mode_hint": None if is_csv_mode else self.input_mode_hint,
+            "cookie_file_path": texts["cookie_file_input"] or None,
+            "selected_styles_data": selected_styles,  # List of (name, prompt_text)
+            "output_language": texts["language_input"],
+            "gemini_api_key": texts["gemini_api_key_input"],
+            "openai_api_key": texts["openai_api_key_input"],
+            "zai_api_key": texts["zai_api_key_input"],
+            "deepseek_api_key": texts["deepseek_api_key_input"],
             "asr_model_id": asr_model_id,
             "phase2_model_id": phase2_model_id,
             "output_base_dir": output_base_dir,
@@ -1219,34 +1543,33 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
 
         # Ensure output directory exists
         output_dir_path = flow_params["output_base_dir"]
+        created = not os.path.isdir(output_dir_path)
         try:
-            if not os.path.exists(output_dir_path):
-                os.makedirs(output_dir_path)
-                self.update_status(
-                    f"Created output directory: {output_dir_path}", StatusType.INFO
-                )
+            os.makedirs(output_dir_path, exist_ok=True)
         except OSError as e:
             self.handle_error(
                 f"Could not create output directory: {output_dir_path} - {e}"
             )
             self.set_processing_state(False)
             return
+        if created:
+            self.update_status(f"Created output directory: {output_dir_path}", StatusType.INFO)
 
         # Ensure intermediate directory exists
         intermediate_dir_path = flow_params["intermediate_dir"]
+        created = not os.path.isdir(intermediate_dir_path)
         try:
-            if not os.path.exists(intermediate_dir_path):
-                os.makedirs(intermediate_dir_path)
-                self.update_status(
-                    f"Created intermediate directory: {intermediate_dir_path}",
-                    StatusType.INFO,
-                )
+            os.makedirs(intermediate_dir_path, exist_ok=True)
         except OSError as e:
             self.handle_error(
                 f"Could not create intermediate directory: {intermediate_dir_path} - {e}"
             )
             self.set_processing_state(False)
             return
+        if created:
+            self.update_status(
+                f"Created intermediate directory: {intermediate_dir_path}", StatusType.INFO
+            )
 
         # Start PocketFlow execution in background thread
         start_msg = (
@@ -1260,188 +1583,318 @@ class BodhiFlow_GUI_MainWindow(QMainWindow):  # Renamed class
 
         # Create and start PocketFlow runner thread
         self.pocketflow_runner = PocketFlowRunner(flow_params)
-        self.pocketflow_runner.status_update.connect(self.update_status)
-        self.pocketflow_runner.progress_update.connect(self.update_gui_progress)
-        self.pocketflow_runner.flow_complete.connect(
-            lambda: self.handle_success(flow_params["output_base_dir"])
-        )
+        # Queued explicitly: these slots touch widgets and must run on the GUI thread
+        self.pocketflow_runner.status_update.connect(self.update_status, Qt.QueuedConnection)
+        self.pocketflow_runner.progress_update.connect(self._on_progress, Qt.QueuedConnection)
+        self._run_output_dir = flow_params["output_base_dir"]
+        self.pocketflow_runner.flow_complete.connect(self._on_flow_complete, Qt.QueuedConnection)
+        self.pocketflow_runner.finished.connect(self._on_runner_finished, Qt.QueuedConnection)
+        self._runner_active = True
         self.pocketflow_runner.start()
 
-    @pyqtSlot(int)  # Add this decorator if not already present
+    @pyqtSlot()
+    def _on_flow_complete(self):
+        self.handle_success(self._run_output_dir)
+
+    @pyqtSlot(int)
+    def _on_progress(self, progress_percent):
+        """Runner progress: keep only the latest value; the progress timer applies it (~30 Hz max).
+        Values still queued after the run was reset (cancel, error) are dropped."""
+        if not self.is_processing:
+            return
+        self._pending_progress = progress_percent
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    @pyqtSlot()
+    def _apply_pending_progress(self):
+        if self._pending_progress is not None:
+            self.update_gui_progress(self._pending_progress)
+
+    @pyqtSlot(int)
     def update_gui_progress(self, progress_percent):
+        # A direct update (start, finish, cancel, error resets) is applied immediately
+        # and supersedes any queued runner value
+        self._pending_progress = None
+        self._progress_timer.stop()
+        if progress_percent == self._last_progress:
+            return  # unchanged: skip the QProgressBar repaint
+        self._last_progress = progress_percent
         self.progress_bar.setValue(progress_percent)
 
-    @pyqtSlot(str, StatusType)
+    @pyqtSlot(str, object)  # matches PocketFlowRunner.status_update
     def update_status(self, message, msg_type=StatusType.INFO):
         """Updates the status display with color-coded messages based on type and logs to file."""
+        assert QThread.currentThread() is self.thread(), "update_status must run on the GUI thread"
         # Update GUI display
-        color = STATUS_COLORS.get(msg_type, STATUS_COLORS[StatusType.INFO])
-        # Ensure message is safely representable in HTML and terminal
-        safe_message = message
-        try:
-            safe_message.encode('utf-8')
-        except Exception:
+        # Ensure message is safely representable in HTML and terminal (ASCII needs no check;
+        # otherwise lone surrogates become "?")
+        if isinstance(message, str) and message.isascii():
+            safe_message = message
+        else:
             safe_message = str(message).encode('utf-8', errors='replace').decode('utf-8')
-        self.status_display.append(f"<font color='{color}'>{safe_message}</font>")
+        template = _STATUS_HTML.get(msg_type) or _STATUS_HTML[StatusType.INFO]
+        self._status_buffer.append(template.format(safe_message))
+        if not self._status_flush_timer.isActive():
+            self._status_flush_timer.start()
 
         # Also log to file using appropriate logging level
         log_level = GUI_STATUS_TO_LOG_LEVEL.get(msg_type, logging.INFO)
         gui_logger.log(log_level, f"[GUI Status] {message}")
 
+    @pyqtSlot()
+    def _flush_status(self):
+        """Write queued status lines to status_display as one edit block (one relayout)."""
+        if not self._status_buffer:
+            return
+        display = self.status_display
+        scrollbar = display.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        doc = display.document()
+        cursor = QTextCursor(doc)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        buffer = self._status_buffer
+        while buffer:
+            if not doc.isEmpty():
+                cursor.insertBlock()
+            cursor.insertHtml(buffer.popleft())
+        cursor.endEditBlock()
+        if at_bottom:  # follow the log like QTextEdit.append does
+            scrollbar.setValue(scrollbar.maximum())
+
     def handle_success(self, output_path):
         self.set_processing_state(False)
         self.update_status(
             f"Processing complete! Output files should be in folder: {output_path}",
             StatusType.FINISH,
         )
-        self.progress_bar.setValue(100)
+        self.update_gui_progress(100)
 
     def handle_error(self, error_message):
         self.set_processing_state(False)
         self.update_status(f"Error occurred: {error_message}", StatusType.ERROR)
-        msg_box = QMessageBox(self)
-        msg_box.setIcon(QMessageBox.Critical)
+        msg_box = self._error_box
+        if msg_box is None:
+            msg_box = self._error_box = QMessageBox(self)
+            msg_box.setIcon(QMessageBox.Critical)
+            msg_box.setWindowTitle("Error")
         msg_box.setText(str(error_message))  # Ensure error is string
-        msg_box.setWindowTitle("Error")
-        msg_box.exec_()
-        self.progress_bar.setValue(0)
+        if self._error_box_active:
+            # Already open: it now shows the latest error
+            return
+        self._error_box_active = True
+        try:
+            msg_box.exec_()
+        finally:
+            self._error_box_active = False
+        self.update_gui_progress(0)
 
+    @pyqtSlot()
     def cancel_processing(self):
         """Cancel the currently running PocketFlow processing."""
-        if hasattr(self, 'pocketflow_runner') and self.pocketflow_runner.isRunning():
-            # Request the thread to stop
+        if self._cancelling or self._runner_join_signals is not None:
+            return
+        if self._runner_active:
+            # Request the thread to stop; _on_runner_finished completes the cancel
+            self._cancelling = True
+            self.cancel_button.setEnabled(False)
             self.pocketflow_runner.stop()
-            
             # Give the thread some time to stop gracefully
-            if not self.pocketflow_runner.wait(5000):  # Wait up to 5 seconds
-                # If it doesn't stop gracefully, terminate it
-                self.pocketflow_runner.terminate()
-                self.pocketflow_runner.wait()
-                self.update_status("Processing forcefully terminated", StatusType.WARNING)
-            else:
-                self.update_status("Processing cancelled by user", StatusType.WARNING)
-        else:
-            self.update_status("No active processing to cancel", StatusType.INFO)
+            self._cancel_deadline.start()
+            return
+
+        self.update_status("No active processing to cancel", StatusType.INFO)
+        self.set_processing_state(False)
+        self.update_gui_progress(0)
 
+    @pyqtSlot()
+    def _on_runner_finished(self):
+        """Runner thread exited; finish a pending cancel."""
+        self._runner_active = False
+        if not self._cancelling:
+            return
+        self._cancelling = False
+        self._cancel_deadline.stop()
+        self.update_status("Processing cancelled by user", StatusType.WARNING)
+        self.set_processing_state(False)
+        self.update_gui_progress(0)
+
+    @pyqtSlot()
+    def _on_cancel_deadline(self):
+        """The runner ignored the stop request for too long: terminate it."""
+        if not self._cancelling:
+            return
+        self._cancelling = False
+        if self.pocketflow_runner.isRunning():
+            self.pocketflow_runner.terminate()
+            # Join on a pool thread: wait() can hang on I/O the thread was stuck in
+            self.update_status("Stopping...", StatusType.WARNING)
+            task = RunnerJoinTask(self.pocketflow_runner)
+            task.signals.joined.connect(self._on_runner_joined)
+            self._runner_join_signals = task.signals  # keep alive until the thread is joined
+            QThreadPool.globalInstance().start(task)
+            return
+        self._on_runner_joined()
+
+    @pyqtSlot()
+    def _on_runner_joined(self):
+        """A terminated runner thread has exited."""
+        from core.nodes import reset_acquisition_pool, reset_refinement_loop
+
+        self._runner_active = False
+        self._runner_join_signals = None
+        # The killed run never collected its Phase 1 futures; drop its queued
+        # work so it does not keep the shared pool busy into the next run
+        reset_acquisition_pool()
+        # ...and may have died inside the Phase 2 event loop, leaving it
+        # flagged as running
+        reset_refinement_loop()
+        self.update_status("Processing forcefully terminated", StatusType.WARNING)
         self.set_processing_state(False)
-        self.progress_bar.setValue(0)
+        self.update_gui_progress(0)
 
+    def _pick_dir(self, title):
+        """
+        Ask for a folder with the shared folder dialog (created on first use).
+        Opens at the last picked folder; returns the chosen path, or "" if cancelled.
+        """
+        dlg = self._dir_dialog
+        if dlg is None:
+            dlg = self._dir_dialog = QFileDialog(self)
+            dlg.setFileMode(QFileDialog.Directory)
+            dlg.setOptions(self._dir_dialog_options)
+        dlg.setWindowTitle(title)
+        if self._last_dir:
+            dlg.setDirectory(self._last_dir)
+        if not dlg.exec_():
+            return ""
+        self._last_dir = dlg.selectedFiles()[0]
+        return self._last_dir
+
+    def _pick_file(self, title, name_filter, save=False, default_suffix=""):
+        """
+        Ask for a file to open (or save); returns "" if cancelled.
+        One dialog per (name_filter, save, default_suffix) is created on first use and
+        reused, so its filters, mode and suffix are set only once. default_suffix (save
+        only) is appended by the dialog to names typed without an extension.
+        """
+        key = (name_filter, save, default_suffix)
+        dlg = self._file_dialogs.get(key)
+        if dlg is None:
+            dlg = self._file_dialogs[key] = QFileDialog(self)
+            dlg.setOptions(self._file_dialog_options)
+            dlg.setAcceptMode(QFileDialog.AcceptSave if save else QFileDialog.AcceptOpen)
+            dlg.setFileMode(QFileDialog.AnyFile if save else QFileDialog.ExistingFile)
+            dlg.setNameFilter(name_filter)
+            if default_suffix:
+                dlg.setDefaultSuffix(default_suffix)
+        dlg.setWindowTitle(title)
+        return dlg.selectedFiles()[0] if dlg.exec_() else ""
+
+    @pyqtSlot()
     def select_intermediate_transcript_directory(self):
-        options = QFileDialog.Options()
-        options |= QFileDialog.ShowDirsOnly
-        dir_path = QFileDialog.getExistingDirectory(
-            self,
-            "Select Intermediate Transcript Folder",
-            "",
-            options=options,
-        )
+        dir_path = self._pick_dir("Select Intermediate Transcript Folder")
         if dir_path:
             self.intermediate_dir_input.setText(dir_path)
 
+    @pyqtSlot()
     def select_cookie_file(self):
-        options = QFileDialog.Options()
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select Cookie File",
-            "",
-            "Text Files (*.txt);;All Files (*)",
-            options=options,
-        )
+        file_path = self._pick_file("Select Cookie File", _FILTER_TXT)
         if file_path:
             self.cookie_file_input.setText(file_path)
 
-    def _on_url_input_changed(self):
+    @pyqtSlot(str)
+    def _on_url_input_changed(self, _text):
+        """Restart the debounce timer on every edit of the input path."""
+        self._url_debounce.start()
+
+    @pyqtSlot()
+    def _on_url_input_changed_debounced(self):
         """Clear folder-type hint when user edits the input path manually."""
         self.input_mode_hint = None
         self._update_folder_button_styles()
 
+    def _set_url_text(self, text, mode_hint=None):
+        """Programmatic write to the input path: apply the folder hint now instead of via the debounce timer."""
+        with QSignalBlocker(self.url_input):
+            self.url_input.setText(text)
+        self._url_debounce.stop()
+        self.input_mode_hint = mode_hint
+        self._update_folder_button_styles()
+
+    @pyqtSlot()
     def _on_select_media_folder(self):
-        options = QFileDialog.Options()
-        options |= QFileDialog.ShowDirsOnly
-        dir_path = QFileDialog.getExistingDirectory(
-            self, "Select Media/Video Folder", "", options=options
-        )
+        dir_path = self._pick_dir("Select Media/Video Folder")
         if dir_path:
-            self.url_input.setText(dir_path)
-            self.input_mode_hint = "media_folder"
-            self._update_folder_button_styles()
+            self._set_url_text(dir_path, "media_folder")
 
+    @pyqtSlot()
     def _on_select_document_folder(self):
-        options = QFileDialog.Options()
-        options |= QFileDialog.ShowDirsOnly
-        dir_path = QFileDialog.getExistingDirectory(
-            self, "Select Document Folder (PDF/Word/TXT)", "", options=options
-        )
+        dir_path = self._pick_dir("Select Document Folder (PDF/Word/TXT)")
         if dir_path:
-            self.url_input.setText(dir_path)
-            self.input_mode_hint = "document_folder"
-            self._update_folder_button_styles()
+            self._set_url_text(dir_path, "document_folder")
 
+    @pyqtSlot(bool)
     def _on_batch_checkbox_changed(self, checked):
         is_csv = checked
-        self.url_input.setVisible(not is_csv)
-        self.btn_media_folder.setVisible(not is_csv)
-        self.btn_doc_folder.setVisible(not is_csv)
-        self.csv_row_container.setVisible(is_csv)
-        self.phase_1_only_checkbox.setEnabled(not is_csv)
-        self.phase_2_only_checkbox.setEnabled(not is_csv)
-        if is_csv:
-            self.url_input.clear()
-            self.input_mode_hint = None
-            self._update_folder_button_styles()
-        else:
-            self.csv_path = None
-            self.csv_path_display.clear()
+        # One relayout/repaint for the whole swap between the URL row and the CSV row
+        self.setUpdatesEnabled(False)
+        try:
+            self.url_input.setVisible(not is_csv)
+            self.btn_media_folder.setVisible(not is_csv)
+            self.btn_doc_folder.setVisible(not is_csv)
+            if is_csv and self.csv_row_container is None:
+                self._build_csv_row()
+            if self.csv_row_container is not None:
+                self.csv_row_container.setVisible(is_csv)
+            self.phase_1_only_checkbox.setEnabled(not is_csv)
+            self.phase_2_only_checkbox.setEnabled(not is_csv)
+            if is_csv:
+                self._set_url_text("")
+            else:
+                self.csv_path = None
+                if self.csv_path_display is not None:
+                    self.csv_path_display.clear()
+        finally:
+            self.setUpdatesEnabled(True)
         # Batch checkbox is always visible in Options section, no need to change visibility
 
     def _update_folder_button_styles(self):
-        """Set folder buttons to green when that folder type was selected; otherwise default light gray.
-        Also show/hide Recursive checkbox based on folder selection."""
-        if self.input_mode_hint == "media_folder":
-            self.btn_media_folder.setStyleSheet("QPushButton { background-color: #008000; padding: 2px;}")
-            self.btn_doc_folder.setStyleSheet("QPushButton { background-color: #D3D3D3; padding: 2px;}")
-            self.document_folder_recursive_checkbox.setVisible(True)  # Show for media folder (recursive supported)
-        elif self.input_mode_hint == "document_folder":
-            self.btn_media_folder.setStyleSheet("QPushButton { background-color: #D3D3D3; padding: 2px;}")
-            self.btn_doc_folder.setStyleSheet("QPushButton { background-color: #008000; padding: 2px;}")
-            self.document_folder_recursive_checkbox.setVisible(True)  # Show only when document folder is selected
-        else:
-            self.btn_media_folder.setStyleSheet("QPushButton { background-color: #D3D3D3; padding: 2px;}")
-            self.btn_doc_folder.setStyleSheet("QPushButton { background-color: #D3D3D3; padding: 2px;}")
-            self.document_folder_recursive_checkbox.setVisible(False)  # Hide when no folder selected
-
+        """Mark the folder button of the selected folder type active (green in styles.qss); otherwise light gray.
+        Also show/hide Recursive checkbox based on folder selection.
+        No-op when the hint has not changed since the last call."""
+        hint = self.input_mode_hint
+        if hint == self._styled_mode_hint:
+            return
+        self._styled_mode_hint = hint
+        for btn, mode in ((self.btn_media_folder, "media_folder"), (self.btn_doc_folder, "document_folder")):
+            active = hint == mode
+            if btn.property("folderActive") != active:
+                btn.setProperty("folderActive", active)
+                # Re-evaluate the [folderActive] selector without re-parsing any stylesheet
+                style = btn.style()
+                style.unpolish(btn)
+                style.polish(btn)
+        # Shown for either folder type (recursive supported), hidden when no folder selected
+        show_recursive = hint in ("media_folder", "document_folder")
+        if self.document_folder_recursive_checkbox.isHidden() == show_recursive:
+            self.document_folder_recursive_checkbox.setVisible(show_recursive)
+
+    @pyqtSlot()
     def _on_select_csv_file(self):
-        path, _ = QFileDialog.getOpenFileName(
-            self, "Select CSV File", "", "CSV (*.csv);;All Files (*)"
-        )
+        path = self._pick_file("Select CSV File", _FILTER_CSV)
         if path:
             self.csv_path = path
             self.csv_path_display.setText(path)
 
+    @pyqtSlot()
     def select_summary_output_directory(self):
-        options = QFileDialog.Options()
-        options |= QFileDialog.ShowDirsOnly
-        dir_path = QFileDialog.getExistingDirectory(
-            self,
-            "Select Main Output Folder",
-            "",
-            options=options,  # Updated title
-        )
+        dir_path = self._pick_dir("Select Main Output Folder")
         if dir_path:
             self.summary_output_dir_input.setText(dir_path)  # Updated field name
 
     def select_output_file(self, title, field, is_save=True):
-        options = QFileDialog.Options()
-        if is_save:
-            file_path, _ = QFileDialog.getSaveFileName(
-                self, title, "", "Text Files (*.txt);;All Files (*)", options=options
-            )
-        else:
-            file_path, _ = QFileDialog.getOpenFileName(
-                self, title, "", "Text Files (*.txt);;All Files (*)", options=options
-            )
-
+        file_path = self._pick_file(title, _FILTER_TXT, save=is_save, default_suffix="txt")
         if file_path:
-            if is_save and not file_path.endswith(".txt"):
-                file_path += ".txt"  # Ensure .txt for save dialogs
             field.setText(file_path)
@@ -0,0 +1,60 @@
+"""
+Tests for utils.csv_batch comment handling.
+
+Run from the project root: python -m unittest discover tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.csv_batch import parse_bodhiflow_csv
+
+
+class CommentRowTests(unittest.TestCase):
+    def _parse(self, text: str):
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        self.addCleanup(os.remove, path)
+        return parse_bodhiflow_csv(path)
+
+    def test_hash_line_inside_quoted_field_is_kept(self):
+        jobs = self._parse(
+            "input,language\n"
+            '"https://youtu.be/x","English\n# second line"\n'
+            "https://youtu.be/y,French\n"
+        )
+        self.assertEqual(len(jobs), 2)
+        self.assertEqual(jobs[0]["language"], "English\n# second line")
+        self.assertEqual(jobs[1]["input"], "https://youtu.be/y")
+
+    def test_comment_rows_are_skipped(self):
+        jobs = self._parse(
+            "# BodhiFlow batch\n"
+            "input,language\n"
+            "  # commented out,German\n"
+            "https://youtu.be/y,French\n"
+        )
+        self.assertEqual([j["input"] for j in jobs], ["https://youtu.be/y"])
+
+    def test_error_reports_physical_line_after_comment_rows(self):
+        with self.assertRaisesRegex(ValueError, r"^Row 5:"):
+            self._parse(
+                "input,language\n"
+                "# skipped for now,German\n"
+                '"https://youtu.be/x","multi\nline"\n'
+                ",French\n"
+            )
+
+    def test_short_row_reads_missing_cells_as_empty(self):
+        jobs = self._parse("input,language,output_subdir\nhttps://youtu.be/y\n")
+        self.assertIsNone(jobs[0]["language"])
+        self.assertIsNone(jobs[0]["output_subdir"])
+
+
+if __name__ == "__main__":
+    unittest.main()
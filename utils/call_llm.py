@@ -9,6 +9,7 @@ Migrated to google-genai (google.genai) – see https://ai.google.dev/gemini-api
 
 import os
 import time
+from functools import lru_cache
 from typing import Any, Optional
 
 from google import genai
@@ -27,11 +28,28 @@ except ImportError:
     _ZAI_AVAILABLE = False
 
 
+@lru_cache(maxsize=None)
+def _get_client(provider: str, api_key: str) -> Any:
+    """
+    SDK client for (provider, api_key), created once and reused.
+
+    Calls share the client's HTTP connection pool, so TLS/DNS setup to the
+    provider is paid once instead of per call.
+    """
+    if provider == "gemini":
+        return genai.Client(api_key=api_key)
+    if provider == "deepseek":
+        return OpenAI(api_key=api_key, base_url="https://api.deepseek.com")
+    if provider == "zai":
+        return ZaiClient(api_key=api_key)
+    return OpenAI(api_key=api_key)
+
+
 def _call_gemini(prompt: str, model_name: str, api_key: str, max_retries: int) -> str:
     key = api_key or os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
     if not key:
         raise ValueError("No API key provided and GEMINI_API_KEY/GOOGLE_API_KEY not set")
-    client = genai.Client(api_key=key)
+    client = _get_client("gemini", key)
     for attempt in range(max_retries):
         try:
             response = client.models.generate_content(model=model_name, contents=prompt)
@@ -52,7 +70,7 @@ def _call_openai(prompt: str, model_name: str, api_key: str, max_retries: int) -
         api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
         raise ValueError("No OpenAI API key provided and OPENAI_API_KEY not set")
-    client = OpenAI(api_key=api_key)
+    client = _get_client("openai", api_key)
     messages = [{"role": "user", "content": prompt}]
     for attempt in range(max_retries):
         try:
@@ -70,7 +88,7 @@ def _call_deepseek(prompt: str, model_name: str, api_key: str, max_retries: int)
         api_key = os.environ.get("DEEPSEEK_API_KEY")
     if not api_key:
         raise ValueError("No DeepSeek API key provided and DEEPSEEK_API_KEY not set")
-    client = OpenAI(api_key=api_key, base_url="https://api.deepseek.com")
+    client = _get_client("deepseek", api_key)
     messages = [{"role": "user", "content": prompt}]
     for attempt in range(max_retries):
         try:
@@ -90,7 +108,7 @@ def _call_zai(prompt: str, model_name: str, api_key: str, max_retries: int) -> s
         api_key = os.environ.get("ZAI_API_KEY")
     if not api_key:
         raise ValueError("No ZAI API key provided and ZAI_API_KEY not set")
-    client = ZaiClient(api_key=api_key)
+    client = _get_client("zai", api_key)
     messages = [{"role": "user", "content": prompt}]
     for attempt in range(max_retries):
         try:
@@ -3,18 +3,31 @@ CSV batch parsing for BodhiFlow.
 
 Parses a CSV file into a list of jobs; each job can override styles, language, output_subdir.
 Encoding: UTF-8 only (with or without BOM). Styles must match GUI refinement style labels exactly.
+Rows whose first cell starts with '#' are comments and are skipped. The file is memory-mapped
+and decoded line by line, so no full-text copy of it is held while parsing.
+Parsed results are cached per (absolute path, mtime, size), so validating in the GUI and
+parsing again in the runner only reads the file once while it is unchanged.
 """
 
 import csv
-import io
+import functools
+import mmap
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from utils.logger_config import get_logger
 
 logger = get_logger(__name__)
 
 
+class JobOverride(NamedTuple):
+    """Per-job Phase 2 overrides from a CSV row (None = use the GUI setting)."""
+
+    styles: list[str] | None = None
+    language: str | None = None
+    output_subdir: str | None = None
+
+
 def _get_valid_style_names() -> set:
     """Return set of valid refinement style names (must match GUI/prompts)."""
     try:
@@ -33,6 +46,8 @@ def parse_bodhiflow_csv(csv_path: str) -> list[dict[str, Any]]:
     - styles: optional, comma-separated; must match GUI style labels exactly
     - language, output_subdir: optional
     - run_phase_1, run_phase_2: optional (1/0 or true/false); ignored in GUI CSV mode
+    Rows whose first cell starts with '#' (after leading blanks) are skipped; a '#' line inside
+    a quoted multi-line field is part of that field.
 
     Encoding: UTF-8 only. Other encodings raise ValueError with message to re-save as UTF-8.
 
@@ -40,39 +55,85 @@ def parse_bodhiflow_csv(csv_path: str) -> list[dict[str, Any]]:
         List of dicts: [{"job_id": 1, "input": str, "styles": list[str]|None, "language": str|None, "output_subdir": str|None, ...}, ...]
     """
     path = Path(csv_path)
-    if not path.exists():
-        raise FileNotFoundError(f"CSV file not found: {csv_path}")
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"CSV file not found: {csv_path}") from None
+
+    # Fresh dicts (and style lists) per call: callers may edit the jobs they get
+    return [
+        dict(job, styles=list(job["styles"]) if job["styles"] else None)
+        for job in _parse_cached(str(path.resolve()), st.st_mtime_ns, st.st_size)
+    ]
 
+
+@functools.lru_cache(maxsize=8)
+def _parse_cached(abs_path: str, mtime_ns: int, size: int) -> tuple[dict[str, Any], ...]:
+    """Parse once per file version; mtime_ns/size are only part of the cache key."""
+    return tuple(_parse_csv_file(Path(abs_path)))
+
+
+def _parse_csv_file(path: Path) -> list[dict[str, Any]]:
+    """Read and validate the CSV at path (see parse_bodhiflow_csv)."""
+    csv_path = str(path)
     valid_styles = _get_valid_style_names()
 
-    # Read with UTF-8 (allow BOM)
-    try:
-        raw = path.read_bytes()
-        if raw.startswith(b"\xef\xbb\xbf"):
-            text = raw.decode("utf-8-sig")
-        else:
-            text = raw.decode("utf-8")
-    except UnicodeDecodeError as e:
-        raise ValueError(
-            "CSV encoding is not UTF-8. Please save the CSV as UTF-8 (e.g. in Excel: Save As -> CSV UTF-8)."
-        ) from e
-
-    reader = csv.DictReader(io.StringIO(text))
-    if not reader.fieldnames:
+    # Read with UTF-8 (allow BOM); mmap of a 0-byte file is not allowed
+    if path.stat().st_size == 0:
+        return []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        try:
+            return _jobs_from_lines(_decoded_lines(mm), valid_styles, csv_path)
+        except UnicodeDecodeError as e:
+            raise ValueError(
+                "CSV encoding is not UTF-8. Please save the CSV as UTF-8 (e.g. in Excel: Save As -> CSV UTF-8)."
+            ) from e
+
+
+def _decoded_lines(mm: mmap.mmap):
+    """Yield UTF-8 lines from mm, skipping a leading BOM."""
+    if mm[:3] == b"\xef\xbb\xbf":
+        mm.seek(3)
+    for line in iter(mm.readline, b""):
+        yield line.decode("utf-8")
+
+
+def _csv_rows(lines):
+    """
+    Yield (line_no, row) for parsed CSV rows, dropping blank rows and '#' comment rows.
+
+    line_no is the 1-based line of the file the row starts on. Comments are
+    recognised after csv has tokenised the input, so a quoted field spanning
+    several lines may contain lines that start with '#'.
+    """
+    reader = csv.reader(lines)
+    line_no = 1
+    for row in reader:
+        if row and not row[0].lstrip().startswith("#"):
+            yield line_no, row
+        line_no = reader.line_num + 1
+
+
+def _jobs_from_lines(lines, valid_styles: set, csv_path: str) -> list[dict[str, Any]]:
+    """Validate CSV rows from lines and build the job list (see parse_bodhiflow_csv)."""
+    rows = _csv_rows(lines)
+    _, header = next(rows, (0, None))
+    if not header:
         return []
 
     # Normalize column names to lower case for lookup
-    fieldnames = [f.strip().lower() for f in reader.fieldnames]
+    fieldnames = [f.strip().lower() for f in header]
     if "input" not in fieldnames:
         raise ValueError("CSV must have an 'input' column.")
 
     jobs = []
-    for row_idx, row in enumerate(reader, start=2):
-        # Build row dict with normalized keys
-        raw_row = {k.strip().lower(): v.strip() if isinstance(v, str) else v for k, v in row.items()}
+    for line_no, row in rows:
+        # Build row dict with normalized keys (missing trailing cells read as empty)
+        raw_row = dict.fromkeys(fieldnames, "")
+        raw_row.update(zip(fieldnames, (v.strip() for v in row)))
         input_val = raw_row.get("input", "").strip()
         if not input_val:
-            raise ValueError(f"Row {row_idx}: 'input' is required and cannot be empty.")
+            raise ValueError(f"Row {line_no}: 'input' is required and cannot be empty.")
 
         styles_raw = raw_row.get("styles", "").strip()
         styles_list = None
@@ -81,7 +142,7 @@ def parse_bodhiflow_csv(csv_path: str) -> list[dict[str, Any]]:
             for part in parts:
                 if part not in valid_styles:
                     raise ValueError(
-                        f"Row {row_idx}: style '{part}' is not valid. "
+                        f"Row {line_no}: style '{part}' is not valid. "
                         f"Styles must match GUI options exactly. Valid: {sorted(valid_styles)}"
                     )
             styles_list = parts
@@ -6,6 +6,7 @@ This module provides functions to:
 - List video/audio files or document files in a directory
 """
 
+import functools
 import json
 import os
 import re
@@ -34,12 +35,48 @@ _DOCUMENT_EXTENSIONS = (
     | _MSG_FILE_EXTENSIONS
 )
 
+# URL prefix patterns used to classify input, compiled once
+_YOUTUBE_URL_RE = re.compile(r"https?://(www\.)?(youtube\.com|youtu\.be)")
+_HTTP_URL_RE = re.compile(r"https?://")
+
+# clean_filename() patterns, compiled once
+_INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w\s\-_\.]')
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
+# Names the three substitutions would leave unchanged: word characters, '-'
+# and '.', in runs separated by single spaces
+_ALREADY_SAFE_FILENAME_RE = re.compile(r'[\w\-.]+(?: [\w\-.]+)*')
+
+# Device names Windows will not accept as filenames
+_RESERVED_FILENAMES = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL',
+    'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
+})
+
 
 def _url_source_config_path() -> Path:
     """Path to config/url_source_config.json (project root = parent of utils/)."""
     return Path(__file__).resolve().parent.parent / "config" / "url_source_config.json"
 
 
+@functools.lru_cache(maxsize=1)
+def _load_url_sources() -> tuple:
+    """url_sources entries from config, read once per process; () if missing or invalid."""
+    path = _url_source_config_path()
+    if not path.exists():
+        return ()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return ()
+    sources = data.get("url_sources")
+    if not isinstance(sources, list):
+        return ()
+    return tuple(sources)
+
+
 def _get_http_url_source_type(url: str) -> str:
     """
     Match an http(s) URL against url_sources in config. First match wins.
@@ -53,20 +90,7 @@ def _get_http_url_source_type(url: str) -> str:
     except Exception:
         return "unknown_url"
 
-    path = _url_source_config_path()
-    if not path.exists():
-        return "unknown_url"
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except (json.JSONDecodeError, OSError):
-        return "unknown_url"
-
-    sources = data.get("url_sources")
-    if not isinstance(sources, list):
-        return "unknown_url"
-
-    for entry in sources:
+    for entry in _load_url_sources():
         patterns = entry.get("domain_patterns")
         if not isinstance(patterns, list):
             continue
@@ -97,7 +121,7 @@ def get_input_type(input_path: str, input_mode_hint: Optional[str] = None) -> st
         return "file"
 
     # Check if it's a YouTube URL
-    if re.match(r"https?://(www\.)?(youtube\.com|youtu\.be)", s):
+    if _YOUTUBE_URL_RE.match(s):
         if "playlist?list=" in s:
             return "youtube_playlist_url"
         return "youtube_video_url"
@@ -129,7 +153,7 @@ def get_input_type(input_path: str, input_mode_hint: Optional[str] = None) -> st
             return "folder"
 
     # http(s) URL not matched above: use whitelist config
-    if re.match(r"https?://", s):
+    if _HTTP_URL_RE.match(s):
         source_id = _get_http_url_source_type(s)
         if source_id == "webpage_text":
             return "webpage_url"
@@ -263,7 +287,7 @@ def _is_podcast_rss_url(url: str) -> bool:
         return False
     
     # Must be a URL
-    if not re.match(r"https?://", url):
+    if not _HTTP_URL_RE.match(url):
         return False
     
     url_lower = url.lower()
@@ -301,6 +325,7 @@ def _is_podcast_rss_url(url: str) -> bool:
     return False
 
 
+@functools.lru_cache(maxsize=8192)
 def clean_filename(filename: str) -> str:
     """
     Cleans a string to make it safe for use as a filename across different operating systems.
@@ -314,15 +339,19 @@ def clean_filename(filename: str) -> str:
     if not filename:
         return "unnamed"
     
-    # Remove characters that are invalid in filenames (Windows is most restrictive)
-    # Invalid characters: < > : " | ? * \ /
-    cleaned = re.sub(r'[<>:"/\\|?*]', "_", filename)
-    
-    # Remove control characters and other problematic characters
-    cleaned = re.sub(r'[^\w\s\-_\.]', '', cleaned)
-    
-    # Normalize whitespace
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+    if _ALREADY_SAFE_FILENAME_RE.fullmatch(filename):
+        # Most file names and titles need no substitution; one scan instead of three
+        cleaned = filename
+    else:
+        # Remove characters that are invalid in filenames (Windows is most restrictive)
+        # Invalid characters: < > : " | ? * \ /
+        cleaned = _INVALID_FILENAME_CHARS_RE.sub("_", filename)
+
+        # Remove control characters and other problematic characters
+        cleaned = _UNSAFE_FILENAME_CHARS_RE.sub('', cleaned)
+
+        # Normalize whitespace
+        cleaned = _WHITESPACE_RUN_RE.sub(' ', cleaned).strip()
     
     # Remove leading/trailing dots and spaces (problematic on Windows)
     cleaned = cleaned.strip('. ')
@@ -332,13 +361,7 @@ def clean_filename(filename: str) -> str:
         return "unnamed"
     
     # Avoid reserved names on Windows
-    reserved_names = {
-        'CON', 'PRN', 'AUX', 'NUL',
-        'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-        'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-    }
-    
-    if cleaned.upper() in reserved_names:
+    if cleaned.upper() in _RESERVED_FILENAMES:
         cleaned = f"{cleaned}_file"
     
     # Limit length to avoid filesystem issues (leave room for suffixes like _source_audio.ext)
@@ -8,7 +8,10 @@ This module provides functions for:
 - Chunk processing for large content
 """
 
+import hashlib
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
@@ -21,6 +24,48 @@ from .logger_config import get_logger
 # Initialize logger for this module
 logger = get_logger(__name__)
 
+# Sidecar next to each refined .md holding the digest of the inputs it was made from
+DIGEST_SUFFIX = ".hash"
+
+
+@lru_cache(maxsize=1024)
+def _file_digest(path: str, mtime_ns: int, size: int) -> str:
+    """blake2b of a file's bytes; keyed on mtime/size so unchanged files hash once."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def refinement_digest(task: dict, language: str, settings: tuple) -> str:
+    """
+    Digest of everything a refinement output depends on: the transcript's
+    content, the style (name and prompt), the output language and the Phase 2
+    settings (model, chunk size, metadata enhancement) passed in settings.
+    """
+    st = os.stat(task["transcript_file"])
+    h = hashlib.blake2b(digest_size=16)
+    for part in (
+        _file_digest(task["transcript_file"], st.st_mtime_ns, st.st_size),
+        task["style_name"],
+        task["style_prompt"],
+        task.get("language") or language,
+        *(repr(value) for value in settings),
+    ):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def is_refinement_current(task: dict, digest: str) -> bool:
+    """True if the task's output exists and was produced from inputs with this digest."""
+    try:
+        with open(task["output_file"] + DIGEST_SUFFIX, encoding="utf-8") as f:
+            return f.read().strip() == digest and os.path.exists(task["output_file"])
+    except OSError:
+        return False
+
 
 def _call_llm_for_refine(
     prompt: str,
@@ -273,6 +318,12 @@ async def async_refine_single_task(task: dict, gemini_config: dict) -> dict:
 
         # Save refined markdown with front matter
         save_text_to_file(final_md, task["output_file"])
+        if task.get("input_digest"):
+            try:
+                with open(task["output_file"] + DIGEST_SUFFIX, "w", encoding="utf-8") as f:
+                    f.write(task["input_digest"])
+            except OSError as e:  # only costs a re-run next time
+                logger.warning(f"Could not write refinement digest for {task['output_file']}: {e}")
 
         return {
             "status": "success",
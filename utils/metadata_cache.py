@@ -0,0 +1,92 @@
+"""
+On-disk cache of YouTube video metadata for BodhiFlow.
+
+Expanding a playlist or video URL costs a yt-dlp request per video. Results
+are kept in a JSON file in the intermediate folder, so re-running the same
+input (e.g. in resume mode) skips those requests until the entries expire.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from utils.logger_config import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_FILENAME = "_meta_cache.json"
+METADATA_TTL_SECONDS = 24 * 3600  # full video metadata
+
+
+def _cookie_stamp(cookie_path: Optional[str]) -> int:
+    """Cookie file mtime, so entries fetched with other cookies are not reused."""
+    if not cookie_path:
+        return 0
+    try:
+        return int(os.stat(cookie_path).st_mtime)
+    except OSError:
+        return 0
+
+
+class MetadataCache:
+    """
+    URL-keyed metadata cache backed by <cache_dir>/_meta_cache.json.
+
+    Loaded once on construction; call save() to write it back. Reads and
+    writes never raise - a missing or corrupt file is an empty cache.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.path = Path(cache_dir) / CACHE_FILENAME
+        self._entries: dict[str, list] = {}  # key -> [expires_at, value]
+        self._dirty = False
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                loaded = json.load(f)
+            if isinstance(loaded, dict):
+                self._entries = loaded
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable metadata cache {self.path}: {e}")
+
+    @staticmethod
+    def _key(kind: str, url: str, cookie_path: Optional[str]) -> str:
+        return f"{kind}|{_cookie_stamp(cookie_path)}|{url}"
+
+    def get(self, kind: str, url: str, cookie_path: Optional[str] = None) -> Any:
+        """Cached value for (kind, url), or None if absent or expired."""
+        entry = self._entries.get(self._key(kind, url, cookie_path))
+        if not entry or entry[0] < time.time():
+            return None
+        return entry[1]
+
+    def set(self, kind: str, url: str, value: Any, ttl: int, cookie_path: Optional[str] = None) -> None:
+        self._entries[self._key(kind, url, cookie_path)] = [time.time() + ttl, value]
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache back (dropping expired entries) if anything was added."""
+        if not self._dirty:
+            return
+        now = time.time()
+        entries = {k: v for k, v in self._entries.items() if v[0] >= now}
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not save metadata cache {self.path}: {e}")
+
+
+def clear_metadata_cache(cache_dir: str) -> None:
+    """Delete the metadata cache file in cache_dir, if any."""
+    try:
+        os.remove(Path(cache_dir) / CACHE_FILENAME)
+    except FileNotFoundError:
+        pass
@@ -4,8 +4,11 @@ Load ASR and Phase2 model options from config/models_config.json.
 Falls back to built-in defaults when the file is missing.
 Config path: project_root / "config" / "models_config.json"
 (project_root = Path(__file__).parent.parent for this utils package).
+The file is read once per process and the lookups below are memoized, so edits
+take effect on the next start.
 """
 
+import functools
 import json
 from pathlib import Path
 from typing import Any
@@ -28,6 +31,7 @@ def _config_path() -> Path:
     return Path(__file__).resolve().parent.parent / "config" / "models_config.json"
 
 
+@functools.lru_cache(maxsize=1)
 def _load_config() -> dict[str, Any]:
     path = _config_path()
     if not path.exists():
@@ -39,6 +43,7 @@ def _load_config() -> dict[str, Any]:
         return {}
 
 
+@functools.lru_cache(maxsize=None)
 def get_asr_models() -> list[dict[str, Any]]:
     """Return list of ASR model entries (id, label, provider, model_name)."""
     data = _load_config()
@@ -48,6 +53,7 @@ def get_asr_models() -> list[dict[str, Any]]:
     return _DEFAULT_ASR_MODELS.copy()
 
 
+@functools.lru_cache(maxsize=None)
 def get_phase2_models() -> list[dict[str, Any]]:
     """Return list of Phase2 model entries (id, label, provider, model_name, optional default)."""
     data = _load_config()
@@ -57,6 +63,7 @@ def get_phase2_models() -> list[dict[str, Any]]:
     return _DEFAULT_PHASE2_MODELS.copy()
 
 
+@functools.lru_cache(maxsize=None)
 def get_default_asr_id() -> str:
     """Return the default ASR model id (first item if no 'default' key)."""
     models = get_asr_models()
@@ -66,6 +73,7 @@ def get_default_asr_id() -> str:
     return models[0].get("id", "openai/gpt-4o-transcribe") if models else "openai/gpt-4o-transcribe"
 
 
+@functools.lru_cache(maxsize=None)
 def get_default_phase2_id() -> str:
     """Return the default Phase2 model id (first item with default=True, else first)."""
     models = get_phase2_models()
@@ -75,6 +83,7 @@ def get_default_phase2_id() -> str:
     return models[0].get("id", "zai/glm-7-flash") if models else "zai/glm-7-flash"
 
 
+@functools.lru_cache(maxsize=None)
 def get_model_by_id(model_id: str, kind: str) -> dict[str, Any] | None:
     """Return the model entry for the given id. kind is 'asr' or 'phase2'."""
     if kind == "asr":
@@ -87,6 +96,7 @@ def get_model_by_id(model_id: str, kind: str) -> dict[str, Any] | None:
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def get_asr_model_max_concurrency(asr_model_id: str) -> int | None:
     """
     Return the max_concurrency limit for the given ASR model, if set.
@@ -104,6 +114,7 @@ def get_asr_model_max_concurrency(asr_model_id: str) -> int | None:
         return None
 
 
+@functools.lru_cache(maxsize=None)
 def get_phase2_model_max_concurrency(phase2_model_id: str) -> int | None:
     """
     Return the max_concurrency limit for the given Phase2 model, if set.
@@ -3,8 +3,10 @@ Load UI configuration from config/ui_config.json.
 
 Provides default values for checkboxes, chunk size, language, and other
 UI elements. Edit config/ui_config.json to customize without code changes.
+The file is read once per process; edits take effect on the next start.
 """
 
+import functools
 import json
 from pathlib import Path
 from typing import Any
@@ -32,6 +34,7 @@ _DEFAULT_CONFIG = {
     "language": "简体中文",
     "start_index": "1",
     "end_index": "0",
+    "native_file_dialogs": True,
 }
 
 
@@ -40,6 +43,7 @@ def _config_path() -> Path:
     return Path(__file__).resolve().parent.parent / "config" / "ui_config.json"
 
 
+@functools.lru_cache(maxsize=1)
 def get_ui_config() -> dict[str, Any]:
     """
     Load UI config from config/ui_config.json.
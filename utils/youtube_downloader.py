@@ -7,8 +7,9 @@ This module provides functions to:
 """
 
 import os
+import threading
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 import yt_dlp
 from pytubefix import Playlist, YouTube
@@ -19,6 +20,9 @@ from utils.input_handler import clean_filename
 # Initialize logger for this module
 logger = get_logger(__name__)
 
+# Per-thread YoutubeDL instances for fetch_youtube_metadata, keyed by cookie file
+_metadata_ydl = threading.local()
+
 
 def get_video_urls_from_playlist(
     playlist_url: str, cookie_path: Optional[str] = None
@@ -95,17 +99,26 @@ def get_playlist_with_ytdlp(
         return []
 
 
-def fetch_youtube_metadata(video_url: str, cookie_path: Optional[str] = None) -> Dict[str, Any]:
+def get_playlist_entries(
+    playlist_url: str, cookie_path: Optional[str] = None
+) -> List[Tuple[str, str]]:
     """
-    Fetch rich metadata for a YouTube video without downloading it.
+    List a playlist's videos with their titles in one flat yt-dlp request.
 
-    Returns a dict with at least: title, source_url. Best-effort on channel, upload_date, tags, duration.
-    Never raises; on failure returns minimal fields.
+    Used by resume mode to skip videos that already have transcripts before
+    fetching their full metadata.
+
+    Args:
+        playlist_url: The YouTube playlist URL
+        cookie_path: Optional path to cookie file
+
+    Returns:
+        List of (video_url, title) tuples; title is "" when the listing has none
     """
     ydl_opts = {
         "quiet": True,
         "no_warnings": True,
-        "skip_download": True,
+        "extract_flat": "in_playlist",
     }
 
     if cookie_path and os.path.exists(cookie_path):
@@ -113,20 +126,73 @@ def fetch_youtube_metadata(video_url: str, cookie_path: Optional[str] = None) ->
 
     try:
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(video_url, download=False)
-            title = info.get("title") or "Untitled"
-            channel = info.get("uploader") or info.get("channel") or ""
-            upload_date = info.get("upload_date") or ""  # e.g., 20240131
-            tags = info.get("tags") or []
-            duration = info.get("duration")  # seconds
-            return {
-                "title": title,
-                "channel": channel,
-                "upload_date": upload_date,
-                "tags": tags,
-                "duration": duration,
-                "source_url": video_url,
-            }
+            info = ydl.extract_info(playlist_url, download=False)
+
+        entries = []
+        for entry in info.get("entries") or []:
+            if entry and "url" in entry:
+                video_id = entry.get("id", entry.get("url"))
+                entries.append(
+                    (f"https://www.youtube.com/watch?v={video_id}", entry.get("title") or "")
+                )
+        if entries:
+            logger.info(f"Found {len(entries)} videos with titles using yt-dlp")
+            return entries
+    except Exception as e:
+        logger.warning(f"Flat playlist listing failed: {e}")
+
+    # Fall back to the URL-only listing; titles come from the metadata fetch
+    return [(url, "") for url in get_video_urls_from_playlist(playlist_url, cookie_path)]
+
+
+def _get_metadata_ydl(cookie_path: Optional[str]) -> yt_dlp.YoutubeDL:
+    """
+    Return this thread's YoutubeDL for metadata fetches.
+
+    Reusing the instance keeps its HTTP session (and yt-dlp's extractor setup)
+    across the many per-video requests of a playlist expansion.
+    """
+    if not (cookie_path and os.path.exists(cookie_path)):
+        cookie_path = None
+    instances = getattr(_metadata_ydl, "instances", None)
+    if instances is None:
+        instances = _metadata_ydl.instances = {}
+    ydl = instances.get(cookie_path)
+    if ydl is None:
+        ydl_opts = {
+            "quiet": True,
+            "no_warnings": True,
+            "skip_download": True,
+        }
+        if cookie_path:
+            ydl_opts["cookiefile"] = cookie_path
+        ydl = instances[cookie_path] = yt_dlp.YoutubeDL(ydl_opts)
+    return ydl
+
+
+def fetch_youtube_metadata(video_url: str, cookie_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Fetch rich metadata for a YouTube video without downloading it.
+
+    Returns a dict with at least: title (never empty), source_url. Best-effort on channel,
+    upload_date, tags, duration. Never raises; on failure returns minimal fields.
+    """
+    try:
+        ydl = _get_metadata_ydl(cookie_path)
+        info = ydl.extract_info(video_url, download=False)
+        title = info.get("title") or info.get("fulltitle") or "Untitled"
+        channel = info.get("uploader") or info.get("channel") or ""
+        upload_date = info.get("upload_date") or ""  # e.g., 20240131
+        tags = info.get("tags") or []
+        duration = info.get("duration")  # seconds
+        return {
+            "title": title,
+            "channel": channel,
+            "upload_date": upload_date,
+            "tags": tags,
+            "duration": duration,
+            "source_url": video_url,
+        }
     except Exception as e:
         logger.warning(f"fetch_youtube_metadata failed: {e}")
         # Fallback minimal metadata; do not fail the main flow